@@ -10,8 +10,8 @@ section_root_id = "1234"  # Section root ID associated with the program
 primary_contact_id = "5678"  # ID of the primary contact for the program
 work_status = "defining"  # Work status of the program (default is 'defining')
 source_template_id = None  # Optional: Template ID for creating the program
-selected_baselines = "[101, 102]"  # Optional: Baselines selected for the program
-jumpstart_program_ids = "[201, 202]"  # Optional: Jumpstart program IDs
+selected_baselines = [101, 102]  # Optional: List of baseline IDs selected for the program
+jumpstart_program_ids = [201, 202]  # Optional: List of jumpstart program IDs
 clone_program_name = None  # Optional: Name of the program to be cloned
 framework_license_notice = "MIT License"  # Optional: Framework license notice
 raw_format = False  # Set to True if you want raw response instead of parsed JSON
@@ -9,47 +9,28 @@ print(proof)
 
 
 
-# Example using the get_proof_metadata_collection method to retrieve all the 
-# metadata for all the proof.  Use the next_token parameter returned by the 
-# server to manage pagination if you have more than 500 proofs.
+# Example using the iter_proof_metadata method to walk through the metadata
+# for all the proof. Pagination is handled for you: pages of up to `limit`
+# proofs are fetched as you iterate, so only one page is held in memory.
 
 # Define parameters for retrieving proof metadata
-limit = "500"  # Maximum number of results per call (default is 500)
+limit = 500  # Maximum number of results per call (default is 500)
 sort_by = "uploadedOn"  # Field to sort by (default is 'uploadedOn')
 sort_direction = "desc"  # Sort direction ('asc' or 'desc', default is 'desc')
 object_type = "control"  # Optional: Filter by object type (e.g., 'control' or 'label')
 object_id = "12345"  # Optional: Filter by object ID
-raw_format = False  # Set to True if you want raw response instead of parsed JSON
-
-# Initialize an empty list to store all proof metadata
-all_proof_metadata = []
-next_token = None
-
-# Loop to handle pagination and retrieve all proof metadata
-while True:
-    # Fetch proof metadata with pagination support
-    response = hyperproof.get_proof_metadata_collection(
-        limit=limit,
-        sort_by=sort_by,
-        sort_direction=sort_direction,
-        object_type=object_type,
-        object_id=object_id,
-        raw=raw_format
-    )
-
-    # Check if the response contains data and append it to the list
-    if not response or 'data' not in response:
-        raise ValueError("No data returned from get_proof_metadata_collection.")
-
-    all_proof_metadata.extend(response['data'])
-
-    # Retrieve the next token for pagination, if available
-    next_token = response.get('continuationToken')
-
-    # If no next token is present, we've retrieved all the data
-    if not next_token:
-        break
-
-# Process or display the accumulated proof metadata
-for proof in all_proof_metadata:
+
+# Process or display each proof as it arrives
+for proof in hyperproof.iter_proof_metadata(
+    limit=limit,
+    sort_by=sort_by,
+    sort_direction=sort_direction,
+    object_type=object_type,
+    object_id=object_id
+):
     print(proof)
+
+# If you need all the proof metadata as one list, use get_proof_metadata_collection,
+# which accepts the same parameters and returns every page combined.
+all_proof_metadata = hyperproof.get_proof_metadata_collection(object_type=object_type, object_id=object_id)
+print(len(all_proof_metadata))
@@ -1,16 +1,8 @@
-import os
-from dotenv import load_dotenv, find_dotenv
-from functools import wraps
-
-# Load environment variables
-load_dotenv(find_dotenv())
-
-# Get client credentials from environment variables
-client_id = os.getenv("CLIENT_ID")
-client_secret = os.getenv("CLIENT_SECRET")
+import atexit
+import threading
 
 # Import API client and API classes
-from .utils import APIClient
+from .utils import APIClient, collect_all_pages, run_many, clear_caches as clear_cache
 from .controls_api import ControlsAPI
 from .proof_api import ProofAPI
 from .labels_api import LabelsAPI
@@ -22,124 +14,126 @@ from .tasks_api import TasksAPI
 from .task_statuses_api import TaskStatusesAPI
 from .users_api import UsersAPI
 
-# Create a single APIClient instance
-_api_client = APIClient(client_id, client_secret)
-
-class LazyAuth:
-    def __init__(self, api_class):
-        self.api_class = api_class
-        self.instance = None
-
-    def __getattr__(self, name):
-        if self.instance is None:
-            self.instance = self.api_class  # Already initialized with _api_client
-        return getattr(self.instance, name)
-
-def lazy_method(api, method_name):
-    @wraps(getattr(api.api_class, method_name))
-    def wrapper(*args, **kwargs):
-        return getattr(api, method_name)(*args, **kwargs)
-    return wrapper
-
-# Create lazy instances, passing the shared APIClient to each API class
-_controls_api = LazyAuth(ControlsAPI(_api_client))
-_proof_api = LazyAuth(ProofAPI(_api_client))
-_labels_api = LazyAuth(LabelsAPI(_api_client))
-_custom_apps_api = LazyAuth(CustomAppsAPI(_api_client))
-_programs_api = LazyAuth(ProgramsAPI(_api_client))
-_risks_api = LazyAuth(RisksAPI(_api_client))
-_roles_api = LazyAuth(RolesAPI(_api_client))
-_tasks_api = LazyAuth(TasksAPI(_api_client))
-_task_statuses_api = LazyAuth(TaskStatusesAPI(_api_client))
-_users_api = LazyAuth(UsersAPI(_api_client))
-
-# Explicitly expose all methods
-# ControlsAPI methods
-get_controls = lazy_method(_controls_api, 'get_controls')
-get_control_summaries = lazy_method(_controls_api, 'get_control_summaries')
-get_controls_by_user = lazy_method(_controls_api, 'get_controls_by_user')
-update_control = lazy_method(_controls_api, 'update_control')
-add_control_proof = lazy_method(_controls_api, 'add_control_proof')
-get_control_by_id = lazy_method(_controls_api, 'get_control_by_id')
-add_control = lazy_method(_controls_api, 'add_control')
-
-# ProofAPI methods
-get_proof_metadata_collection = lazy_method(_proof_api, 'get_proof_metadata_collection')
-get_proof_contents = lazy_method(_proof_api, 'get_proof_contents')
-get_proof_metadata = lazy_method(_proof_api, 'get_proof_metadata')
-get_proof_by_user = lazy_method(_proof_api, 'get_proof_by_user')
-get_proof_by_label = lazy_method(_proof_api, 'get_proof_by_label')
-add_proof = lazy_method(_proof_api, 'add_proof')
-add_proof_version = lazy_method(_proof_api, 'add_proof_version')
-
-# LabelsAPI methods
-get_labels = lazy_method(_labels_api, 'get_labels')
-get_label_summaries = lazy_method(_labels_api, 'get_label_summaries')
-get_label_by_id = lazy_method(_labels_api, 'get_label_by_id')
-get_labels_by_user = lazy_method(_labels_api, 'get_labels_by_user')
-add_label = lazy_method(_labels_api, 'add_label')
-update_label = lazy_method(_labels_api, 'update_label')
-
-# CustomAppsAPI methods
-get_custom_apps = lazy_method(_custom_apps_api, 'get_custom_apps')
-add_custom_app = lazy_method(_custom_apps_api, 'add_custom_app')
-get_custom_app_by_id = lazy_method(_custom_apps_api, 'get_custom_app_by_id')
-update_custom_app = lazy_method(_custom_apps_api, 'update_custom_app')
-delete_custom_app = lazy_method(_custom_apps_api, 'delete_custom_app')
-get_custom_app_events = lazy_method(_custom_apps_api, 'get_custom_app_events')
-get_custom_app_stats = lazy_method(_custom_apps_api, 'get_custom_app_stats')
-
-# ProgramsAPI methods
-get_programs = lazy_method(_programs_api, 'get_programs')
-get_program_by_id = lazy_method(_programs_api, 'get_program_by_id')
-add_program = lazy_method(_programs_api, 'add_program')
-update_program = lazy_method(_programs_api, 'update_program')
-
-# RisksAPI methods
-get_risks = lazy_method(_risks_api, 'get_risks')
-get_risk_by_id = lazy_method(_risks_api, 'get_risk_by_id')
-get_risks_by_user = lazy_method(_risks_api, 'get_risks_by_user')
-add_risk = lazy_method(_risks_api, 'add_risk')
-update_risk = lazy_method(_risks_api, 'update_risk')
-filter_risks = lazy_method(_risks_api, 'filter_risks')
-
-# TasksAPI methods
-get_all_tasks = lazy_method(_tasks_api, 'get_all_tasks')
-get_all_tasks_by_status = lazy_method(_tasks_api, 'get_all_tasks_by_status')
-add_task = lazy_method(_tasks_api, 'add_task')
-get_task_by_id = lazy_method(_tasks_api, 'get_task_by_id')
-get_tasks_by_user = lazy_method(_tasks_api, 'get_tasks_by_user')
-update_task = lazy_method(_tasks_api, 'update_task')
-add_task_proof = lazy_method(_tasks_api, 'add_task_proof')
-filter_tasks = lazy_method(_tasks_api, 'filter_tasks')
-add_task_comment = lazy_method(_tasks_api, 'add_task_comment')
-
-# TaskStatusesAPI methods
-get_task_statuses = lazy_method(_task_statuses_api, 'get_task_statuses')
-
-# RolesAPI methods
-get_roles = lazy_method(_roles_api, 'get_roles')
-
-# UsersAPI methods
-get_current_user = lazy_method(_users_api, 'get_current_user')
-get_organization_users = lazy_method(_users_api, 'get_organization_users')
+# Explicitly expose all methods, grouped by the API class that implements them
+_API_METHODS = {
+    ControlsAPI: (
+        'get_controls', 'get_control_summaries', 'get_controls_by_user', 'update_control',
+        'add_control_proof', 'get_control_by_id', 'add_control',
+    ),
+    ProofAPI: (
+        'get_proof_metadata_collection', 'aget_proof_metadata_collection', 'iter_proof_metadata',
+        'iter_proof_metadata_prefetched', 'aget_proof_by_user', 'aget_proof_by_label',
+        'get_proof_contents', 'get_proof_metadata', 'get_proof_by_user', 'get_proof_by_label',
+        'iter_proof_by_user', 'iter_proof_by_label', 'get_proofs_by_users',
+        'add_proof', 'add_proof_version',
+    ),
+    LabelsAPI: (
+        'get_labels', 'get_label_summaries', 'get_label_by_id', 'get_labels_by_user',
+        'add_label', 'update_label',
+    ),
+    CustomAppsAPI: (
+        'get_custom_apps', 'add_custom_app', 'get_custom_app_by_id', 'update_custom_app',
+        'delete_custom_app', 'get_custom_app_events', 'get_custom_app_stats',
+    ),
+    ProgramsAPI: (
+        'get_programs', 'get_program_by_id', 'add_program', 'update_program',
+    ),
+    RisksAPI: (
+        'get_risks', 'get_risk_by_id', 'get_risks_by_user', 'add_risk', 'update_risk', 'filter_risks',
+    ),
+    TasksAPI: (
+        'get_all_tasks', 'iter_all_tasks', 'get_all_tasks_by_status', 'add_task', 'get_task_by_id', 'get_tasks_by_user',
+        'update_task', 'add_task_proof', 'filter_tasks', 'add_task_comment',
+    ),
+    TaskStatusesAPI: (
+        'get_task_statuses',
+    ),
+    RolesAPI: (
+        'get_roles',
+    ),
+    UsersAPI: (
+        'get_current_user', 'get_organization_users',
+    ),
+}
+
+# Public function name -> API class that implements it
+_METHOD_TABLE = {name: api_class for api_class, names in _API_METHODS.items() for name in names}
+
+# Companion APIs handed to the classes that use them, so the module-level functions
+# share one UsersAPI, LabelsAPI and TaskStatusesAPI instance: constructor argument -> API class
+_API_DEPENDENCIES = {
+    ControlsAPI: {'users_api': UsersAPI},
+    LabelsAPI: {'users_api': UsersAPI},
+    ProofAPI: {'users_api': UsersAPI, 'labels_api': LabelsAPI},
+    RisksAPI: {'users_api': UsersAPI},
+    TasksAPI: {'users_api': UsersAPI, 'task_statuses_api': TaskStatusesAPI},
+}
+
+# Nothing is constructed at import time. The shared APIClient and each API instance
+# are created the first time one of the functions above is accessed.
+_lock = threading.RLock()
+_api_client = None
+_api_instances = {}
+
+def _get_api_client():
+    """
+    Returns the single APIClient shared by every API class, creating it on first use.
+    """
+    global _api_client
+    with _lock:
+        if _api_client is None:
+            _api_client = APIClient()
+            # Release the pooled connections of the shared client at interpreter shutdown
+            atexit.register(_api_client.close)
+        return _api_client
+
+def _get_api(api_class):
+    """
+    Returns the shared instance of an API class, creating it (and the shared instances of
+    the companion APIs it uses) on first use.
+    """
+    with _lock:
+        api = _api_instances.get(api_class)
+        if api is None:
+            companions = {arg: _get_api(dependency)
+                          for arg, dependency in _API_DEPENDENCIES.get(api_class, {}).items()}
+            api = _api_instances[api_class] = api_class(_get_api_client(), **companions)
+        return api
+
+def __getattr__(name):
+    """
+    Resolves the public API functions on first access (PEP 562). The bound method is
+    cached in the module globals, so later lookups never reach this function.
+    """
+    api_class = _METHOD_TABLE.get(name)
+    if api_class is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    method = getattr(_get_api(api_class), name)
+    globals()[name] = method
+    return method
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 # List all exposed methods
 __all__ = [
     'get_controls', 'get_control_summaries', 'get_controls_by_user', 
     'update_control', 'add_control_proof',
     'get_control_by_id', 'add_control', 'get_proof_metadata_collection',
+    'aget_proof_metadata_collection', 'collect_all_pages', 'run_many', 'iter_proof_metadata',
+    'iter_proof_metadata_prefetched', 'aget_proof_by_user', 'aget_proof_by_label',
     'get_proof_contents', 'get_proof_metadata', 'get_proof_by_user', 
-    'add_proof', 'add_proof_version', 'get_proof_by_label',
+    'add_proof', 'add_proof_version', 'get_proof_by_label', 'iter_proof_by_user', 'iter_proof_by_label',
+    'get_proofs_by_users',
     'get_labels', 'get_label_summaries', 'get_label_by_id', 'add_label', 'update_label', 'get_labels_by_user',
     'get_custom_apps', 'add_custom_app', 'get_custom_app_by_id', 'update_custom_app',
     'delete_custom_app', 'get_custom_app_events', 'get_custom_app_stats',
     'get_programs', 'get_program_by_id', 'add_program', 'update_program',
     'get_risks', 'get_risk_by_id', 'get_risks_by_user', 'add_risk', 'update_risk', 
-    'filter_risks', 'get_all_tasks', 'get_all_tasks_by_status',
+    'filter_risks', 'get_all_tasks', 'iter_all_tasks', 'get_all_tasks_by_status',
     'add_task', 'get_task_by_id', 'get_tasks_by_user', 'update_task', 'add_task_proof',
     'filter_tasks', 'add_task_comment', 'get_task_statuses', 'get_roles',
-    'get_current_user', 'get_organization_users'
+    'get_current_user', 'get_organization_users', 'clear_cache'
 ]
 
 
@@ -9,20 +9,30 @@
 # The ControlsAPI class is responsible for handling interactions with the Controls API.
 # It manages control-related operations such as retrieving, updating, and adding controls.
 
-from .utils import logger
+import os
+from .utils import logger, json_dumps, _clean_params, filter_users, submit, user_id_set, UPLOAD_CHUNK_SIZE, _BaseAPI
 from .users_api import UsersAPI
 
-class ControlsAPI:
+class ControlsAPI(_BaseAPI):
     """
     This class handles interactions with the Controls API of Hyperproof.
     """
     BASE_URL = "https://api.hyperproof.app/v1/controls"
-
-    def __init__(self, api_client):
-        # Use the shared API client
-        self.client = api_client
-        self.users_api = UsersAPI(api_client)
-
+    _URL_ROOT = BASE_URL + "/"
+    _URL_SUMMARIES = BASE_URL + "/summaries"
+    __slots__ = ("_users_api",)
+
+    def __init__(self, api_client, users_api=None):
+        super().__init__(api_client)
+        # An instance passed in (e.g. one the caller already holds) is reused as-is
+        self._users_api = users_api
+
+    @property
+    def users_api(self):
+        # Created on first use when none was passed in
+        if self._users_api is None:
+            self._users_api = UsersAPI(self.client)
+        return self._users_api
 
     def get_controls(self, can_link=None, expand_scopes=None, expand_teams=None, status=None, raw=False):
         """
@@ -35,13 +45,13 @@ class ControlsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format.
         """
-        params = {
-            'canLink': can_link,
-            'expandScopes': expand_scopes,
-            'expandTeams': expand_teams,
-            'status': status
-        }
-        return self.client.get(self.BASE_URL, "/", params=params, raw=raw)
+        params = _clean_params(
+            canLink=can_link,
+            expandScopes=expand_scopes,
+            expandTeams=expand_teams,
+            status=status
+        )
+        return self.client.get(self._URL_ROOT, params=params, raw=raw)
 
     def get_control_by_id(self, control_id, raw=False):
         """
@@ -51,7 +61,7 @@ class ControlsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: JSON response of the control.
         """
-        return self.client.get(self.BASE_URL, f"/{control_id}", raw=raw)
+        return self.client.get(f"{self._URL_ROOT}{control_id}", raw=raw)
 
     def add_control(self, control_identifier, name, description, domain_name, owner, implementation="inProgress"):
         """
@@ -73,7 +83,7 @@ class ControlsAPI:
             "implementation": implementation,
             "owner": owner
         }
-        return self.client.post(self.BASE_URL, "/", data)
+        return self.client.post(self._URL_ROOT, data=data)
 
     # New methods added below
 
@@ -86,11 +96,11 @@ class ControlsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: JSON response of control summaries.
         """
-        params = {
-            'canLink': can_link,
-            'status': status
-        }
-        return self.client.get(self.BASE_URL, "/summaries", params=params, raw=raw)
+        params = _clean_params(
+            canLink=can_link,
+            status=status
+        )
+        return self.client.get(self._URL_SUMMARIES, params=params, raw=raw)
 
     def update_control(self, control_id, **kwargs):
         """
@@ -100,20 +110,23 @@ class ControlsAPI:
         :param kwargs: Key-value pairs of the fields to update.
         :return: JSON response of the updated control.
         """
-        return self.client.patch(self.BASE_URL, f"/{control_id}", kwargs)
+        return self.client.patch(f"{self._URL_ROOT}{control_id}", data=kwargs)
 
-    def add_control_proof(self, control_id, file_path, raw=False):
+    def add_control_proof(self, control_id, file_path, raw=False, chunk_size=UPLOAD_CHUNK_SIZE, progress_callback=None):
         """
-        Add a proof item to a control.
+        Add a proof item to a control. The file is streamed from disk, so large files are not loaded into memory.
 
         :param control_id: The unique ID of the control.
         :param file_path: Path to the file to upload as proof.
         :param raw: If True, return raw response text; otherwise return parsed JSON.
+        :param chunk_size: Number of bytes sent per read while uploading (default 64 KiB).
+        :param progress_callback: Optional callable receiving a MultipartEncoderMonitor (bytes_read, len) as the upload progresses.
         :return: Response data of the newly uploaded proof.
         """
         with open(file_path, 'rb') as file:
-            files = {'file': file}
-            return self.client.post(self.BASE_URL, f"/{control_id}/proof", files=files, raw=raw)
+            files = {'file': (os.path.basename(file_path), file)}
+            return self.client.post(f"{self._URL_ROOT}{control_id}/proof", files=files, raw=raw,
+                                    chunk_size=chunk_size, progress_callback=progress_callback)
 
     def get_controls_by_user(self, userid=None, givenName=None, surname=None, raw=False):
         """
@@ -122,38 +135,28 @@ class ControlsAPI:
         :param userid: The unique identifier of the user (optional).
         :param givenName: The given name of the user (optional).
         :param surname: The surname of the user (optional).
-        :param raw: If True, return raw response; otherwise return parsed JSON.
+        :param raw: If True, return the matching controls as JSON text; otherwise return parsed JSON.
         :return: List of controls associated with the specified user(s).
         """
+        # The user list and the control list are independent requests, so fetch them concurrently
+        controls_future = submit(self.get_controls, raw=False)
+
         # Get all organization users
         org_users = self.users_api.get_organization_users(raw=False)
 
-        if raw:
-            return org_users
-
-        filtered_users = []
-        for user in org_users:
-            if userid and (user.get('id') == userid or user.get('userId') == userid):
-                filtered_users.append(user)
-            elif givenName and surname:
-                if user.get('givenName') == givenName and user.get('surname') == surname:
-                    filtered_users.append(user)
-            elif givenName and user.get('givenName') == givenName:
-                filtered_users.append(user)
-            elif surname and user.get('surname') == surname:
-                filtered_users.append(user)
+        filtered_users = filter_users(org_users, userid=userid, givenName=givenName, surname=surname)
 
         if not filtered_users:
-            return []
+            # Nothing can match, so the control list is not needed
+            controls_future.cancel()
+            return '[]' if raw else []
+
+        # Index the matching users by id once, so each control is checked with a single set lookup
+        owner_ids = user_id_set(filtered_users)
 
-        all_controls = self.get_controls(raw=False)
+        all_controls = controls_future.result()
 
-        user_controls = []
-        for control in all_controls:
-            control_owner = control.get('owner', {})
-            for user in filtered_users:
-                if control_owner.get('id') == user.get('id') or control_owner.get('id') == user.get('userId'):
-                    user_controls.append(control)
-                    break
+        user_controls = [control for control in all_controls or [] if (control.get('owner') or {}).get('id') in owner_ids]
 
-        return user_controls
\ No newline at end of file
+        # The raw form is the JSON text of the matching controls, built from the data already fetched
+        return json_dumps(user_controls).decode('utf-8') if raw else user_controls
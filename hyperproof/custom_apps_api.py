@@ -9,18 +9,16 @@
 # The CustomAppsAPI class handles operations such as retrieving, adding, updating,
 # deleting, and retrieving events/statistics for custom apps.
 
-from .utils import logger
+from .utils import logger, _compact, _BaseAPI
 
-class CustomAppsAPI:
+class CustomAppsAPI(_BaseAPI):
     """
     This class handles interactions with the Custom Apps API of Hyperproof.
     It allows for retrieving, adding, updating, deleting, and retrieving events/statistics for custom apps.
     """
     BASE_URL = "https://api.hyperproof.app/v1/customapps"
-
-    def __init__(self, api_client):
-        # Use the shared API client
-        self.client = api_client
+    _URL_ROOT = BASE_URL + "/"
+    __slots__ = ()
 
     def get_custom_apps(self, raw=False):
         """
@@ -29,7 +27,7 @@ class CustomAppsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.get(self.BASE_URL, "/", raw=raw)
+        return self.client.get(self._URL_ROOT, raw=raw)
 
     def add_custom_app(self, app_type, is_custom, org_id, package_name, package_version, deployment_status="pending", raw=False):
         """
@@ -52,7 +50,7 @@ class CustomAppsAPI:
             "packageVersion": package_version,
             "deploymentStatus": deployment_status
         }
-        return self.client.post(self.BASE_URL, "/", data=data, raw=raw)
+        return self.client.post(self._URL_ROOT, data=data, raw=raw)
 
     def get_custom_app_by_id(self, app_id, raw=False):
         """
@@ -62,7 +60,7 @@ class CustomAppsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.get(self.BASE_URL, f"/{app_id}", raw=raw)
+        return self.client.get(f"{self._URL_ROOT}{app_id}", raw=raw)
 
     def update_custom_app(self, app_id, app_type=None, is_custom=None, package_name=None, package_version=None, deployment_status=None, raw=False):
         """
@@ -77,14 +75,14 @@ class CustomAppsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        data = {
+        data = _compact({
             "appType": app_type,
             "isCustom": is_custom,
             "packageName": package_name,
             "packageVersion": package_version,
             "deploymentStatus": deployment_status
-        }
-        return self.client.patch(self.BASE_URL, f"/{app_id}", data=data, raw=raw)
+        })
+        return self.client.patch(f"{self._URL_ROOT}{app_id}", data=data, raw=raw)
 
     def delete_custom_app(self, app_id, raw=False):
         """
@@ -94,7 +92,7 @@ class CustomAppsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.delete(self.BASE_URL, f"/{app_id}", raw=raw)
+        return self.client.delete(f"{self._URL_ROOT}{app_id}", raw=raw)
 
     def get_custom_app_events(self, app_id, raw=False):
         """
@@ -104,7 +102,7 @@ class CustomAppsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.get(self.BASE_URL, f"/{app_id}/events", raw=raw)
+        return self.client.get(f"{self._URL_ROOT}{app_id}/events", raw=raw)
 
     def get_custom_app_stats(self, app_id, raw=False):
         """
@@ -114,4 +112,4 @@ class CustomAppsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.get(self.BASE_URL, f"/{app_id}/stats", raw=raw)
+        return self.client.get(f"{self._URL_ROOT}{app_id}/stats", raw=raw)
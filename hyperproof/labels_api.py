@@ -9,19 +9,30 @@
 # The LabelsAPI class is responsible for handling interactions with the Labels API,
 # allowing for operations related to labels such as retrieving, adding, and updating labels.
 
-from .utils import logger
+import os
+from .utils import logger, _clean_params, json_dumps, submit, filter_users, user_id_set, ttl_cache, UPLOAD_CHUNK_SIZE, _BaseAPI
 from .users_api import UsersAPI
 
-class LabelsAPI:
+class LabelsAPI(_BaseAPI):
     """
     This class handles interactions with the Labels API of Hyperproof.
     """
     BASE_URL = "https://api.hyperproof.app/v1/labels"
-
-    def __init__(self, api_client):
-        # Use the shared API client
-        self.client = api_client
-        self.users_api = UsersAPI(api_client)
+    _URL_ROOT = BASE_URL + "/"
+    _URL_SUMMARIES = BASE_URL + "/summaries"
+    __slots__ = ("_users_api",)
+
+    def __init__(self, api_client, users_api=None):
+        super().__init__(api_client)
+        # An instance passed in (e.g. one the caller already holds) is reused as-is
+        self._users_api = users_api
+
+    @property
+    def users_api(self):
+        # Created on first use when none was passed in, so LabelsAPI never builds a UsersAPI it does not need
+        if self._users_api is None:
+            self._users_api = UsersAPI(self.client)
+        return self._users_api
 
     def get_labels(self, can_link=None, status=None, raw=False):
         """
@@ -32,36 +43,40 @@ class LabelsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format.
         """
-        params = {
-            'canLink': can_link,
-            'status': status
-        }
-        return self.client.get(self.BASE_URL, "/", params=params, raw=raw)
+        params = _clean_params(
+            canLink=can_link,
+            status=status
+        )
+        return self.client.get(self._URL_ROOT, params=params, raw=raw)
 
+    @ttl_cache(ttl_seconds=120, maxsize=10000)
     def get_label_by_id(self, label_id, raw=False):
         """
         Retrieve a specific label by its unique ID.
+        Responses are cached for two minutes per ID; updates made through this class evict the cached entry.
 
         :param label_id: The ID of the label to retrieve.
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: JSON response of the label.
         """
-        return self.client.get(self.BASE_URL, f"/{label_id}", raw=raw)
+        return self.client.get(f"{self._URL_ROOT}{label_id}", raw=raw)
 
+    @ttl_cache(ttl_seconds=30, maxsize=4)
     def get_label_summaries(self, can_link=None, status=None, raw=False):
         """
         Retrieve label summaries for the organization with optional filters.
+        Responses are cached for 30 seconds; call hyperproof.clear_cache() to force a refresh.
 
         :param can_link: Filter by link permission (optional).
         :param status: Filter label summaries by their status (optional).
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format.
         """
-        params = {
-            'canLink': can_link,
-            'status': status
-        }
-        return self.client.get(self.BASE_URL, "/summaries", params=params, raw=raw)
+        params = _clean_params(
+            canLink=can_link,
+            status=status
+        )
+        return self.client.get(self._URL_SUMMARIES, params=params, raw=raw)
 
     def add_label(self, name, description, raw=False):
         """
@@ -76,7 +91,7 @@ class LabelsAPI:
             "name": name,
             "description": description
         }
-        return self.client.post(self.BASE_URL, "/", data, raw=raw)
+        return self.client.post(self._URL_ROOT, data=data, raw=raw)
 
     def update_label(self, label_id, **kwargs):
         """
@@ -86,20 +101,25 @@ class LabelsAPI:
         :param kwargs: Key-value pairs of the fields to update.
         :return: JSON response of the updated label.
         """
-        return self.client.patch(self.BASE_URL, f"/{label_id}", kwargs)
+        response = self.client.patch(f"{self._URL_ROOT}{label_id}", data=kwargs)
+        LabelsAPI.get_label_by_id.cache_evict(self, label_id)
+        return response
 
-    def add_label_proof(self, label_id, file_path, raw=False):
+    def add_label_proof(self, label_id, file_path, raw=False, chunk_size=UPLOAD_CHUNK_SIZE, progress_callback=None):
         """
-        Add a proof item to a label.
+        Add a proof item to a label. The file is streamed from disk, so large files are not loaded into memory.
 
         :param label_id: The unique ID of the label.
         :param file_path: Path to the file to upload as proof.
         :param raw: If True, return raw response text; otherwise return parsed JSON.
+        :param chunk_size: Number of bytes sent per read while uploading (default 64 KiB).
+        :param progress_callback: Optional callable receiving a MultipartEncoderMonitor (bytes_read, len) as the upload progresses.
         :return: Response data of the newly uploaded proof.
         """
         with open(file_path, 'rb') as file:
-            files = {'file': file}
-            return self.client.post(self.BASE_URL, f"/{label_id}/proof", files=files, raw=raw)
+            files = {'file': (os.path.basename(file_path), file)}
+            return self.client.post(f"{self._URL_ROOT}{label_id}/proof", files=files, raw=raw,
+                                    chunk_size=chunk_size, progress_callback=progress_callback)
 
 
     def get_labels_by_user(self, userid=None, givenName=None, surname=None, raw=False):
@@ -109,37 +129,26 @@ class LabelsAPI:
         :param userid: The unique identifier of the user (optional).
         :param givenName: The given name of the user (optional).
         :param surname: The surname of the user (optional).
-        :param raw: If True, return raw response; otherwise return parsed JSON.
+        :param raw: If True, return the matching labels as JSON text; otherwise return parsed JSON.
         :return: List of labels associated with the specified user(s).
         """
+        # Fetch the labels alongside the organization users, as the two requests are independent
+        labels_future = submit(self.get_labels, raw=False)
         org_users = self.users_api.get_organization_users(raw=False)
 
-        filtered_users = []
-        for user in org_users:
-            if userid and (user.get('id') == userid or user.get('userId') == userid):
-                filtered_users.append(user)
-            elif givenName and surname:
-                if user.get('givenName') == givenName and user.get('surname') == surname:
-                    filtered_users.append(user)
-            elif givenName and user.get('givenName') == givenName:
-                filtered_users.append(user)
-            elif surname and user.get('surname') == surname:
-                filtered_users.append(user)
+        filtered_users = filter_users(org_users, userid=userid, givenName=givenName, surname=surname)
 
         if not filtered_users:
-            return [] if not raw else self.client.get(self.BASE_URL, "/", raw=True)
-
-        all_labels = self.get_labels(raw=False)
-
-        user_labels = []
-        for label in all_labels:
-            created_by = label.get('createdBy')
-            for user in filtered_users:
-                if created_by == user.get('id') or created_by == user.get('userId'):
-                    user_labels.append(label)
-                    break
-
-        if raw:
-            return self.client.get(self.BASE_URL, "/", raw=True)
-        else:
-            return user_labels
+            # Nothing can match, so the label list is not needed
+            labels_future.cancel()
+            return '[]' if raw else []
+
+        # Index the matching users by id once, so each label is checked with a single set lookup
+        user_ids = user_id_set(filtered_users)
+
+        all_labels = labels_future.result()
+
+        user_labels = [label for label in all_labels or [] if label.get('createdBy') in user_ids]
+
+        # The raw form is the JSON text of the matching labels, built from the data already fetched
+        return json_dumps(user_labels).decode('utf-8') if raw else user_labels
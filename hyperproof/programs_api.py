@@ -9,18 +9,16 @@
 # The ProgramsAPI class is responsible for handling interactions with the Programs API,
 # allowing for operations such as retrieving, adding, and updating programs within an organization.
 
-from .utils import logger
+from .utils import logger, _clean_params, _compact, ttl_cache, _BaseAPI
 
-class ProgramsAPI:
+class ProgramsAPI(_BaseAPI):
     """
     This class handles interactions with the Programs API of Hyperproof.
     It allows retrieving, adding, and updating programs within an organization.
     """
     BASE_URL = "https://api.hyperproof.app/v1/programs"
-
-    def __init__(self, api_client):
-        # Use the shared API client
-        self.client = api_client
+    _URL_ROOT = BASE_URL + "/"
+    __slots__ = ()
 
     def get_programs(self, status=None, raw=False):
         """
@@ -30,10 +28,10 @@ class ProgramsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        params = {
-            'status': status
-        }
-        return self.client.get(self.BASE_URL, "/", params=params, raw=raw)
+        params = _clean_params(
+            status=status
+        )
+        return self.client.get(self._URL_ROOT, params=params, raw=raw)
 
     def add_program(self, name, description, section_root_id, primary_contact_id, work_status="defining",
                     source_template_id=None, selected_baselines=None, jumpstart_program_ids=None,
@@ -47,36 +45,38 @@ class ProgramsAPI:
         :param primary_contact_id: The ID of the primary contact for the program.
         :param work_status: The current work status (default is 'defining').
         :param source_template_id: The template ID used for creating the program (optional).
-        :param selected_baselines: Baselines selected for the program (optional).
-        :param jumpstart_program_ids: Jumpstart program IDs (optional).
+        :param selected_baselines: List of baseline IDs selected for the program, e.g. [101, 102] (optional).
+        :param jumpstart_program_ids: List of jumpstart program IDs, e.g. [201, 202] (optional).
         :param clone_program_name: Name of the program to be cloned (optional).
         :param framework_license_notice: Framework license notice (optional).
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        data = {
+        data = _compact({
             "name": name,
             "description": description,
             "sectionRootId": section_root_id,
             "primaryContactId": primary_contact_id,
             "workStatus": work_status,
             "sourceTemplateId": source_template_id,
-            "selectedBaselines": selected_baselines or [],
-            "jumpstartProgramIds": jumpstart_program_ids or [],
+            "selectedBaselines": list(selected_baselines) if selected_baselines is not None else None,
+            "jumpstartProgramIds": list(jumpstart_program_ids) if jumpstart_program_ids is not None else None,
             "cloneProgramName": clone_program_name,
             "frameworkLicenseNotice": framework_license_notice
-        }
-        return self.client.post(self.BASE_URL, "/", data=data, raw=raw)
+        })
+        return self.client.post(self._URL_ROOT, data=data, raw=raw)
 
+    @ttl_cache(ttl_seconds=120, maxsize=10000)
     def get_program_by_id(self, program_id, raw=False):
         """
         Retrieves a specific program by its unique ID.
+        Responses are cached for two minutes per ID; updates made through this class evict the cached entry.
 
         :param program_id: The unique ID of the program.
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.get(self.BASE_URL, f"/{program_id}", raw=raw)
+        return self.client.get(f"{self._URL_ROOT}{program_id}", raw=raw)
 
     def update_program(self, program_id, name=None, description=None, work_status=None,
                        override_health=None, override_health_health=None, override_health_by=None,
@@ -94,7 +94,7 @@ class ProgramsAPI:
         :param override_health_health: Health status to override (e.g., 'critical', 'healthy', optional).
         :param override_health_by: ID of the person overriding health (optional).
         :param override_health_reason: Reason for health override (optional).
-        :param selected_baselines: Updated baselines (optional).
+        :param selected_baselines: Updated list of baseline IDs (optional).
         :param baseline_enabled: Whether baseline is enabled (optional).
         :param framework_version_mapping_id: Framework version mapping ID (optional).
         :param removed_requirement_ids: List of removed requirement IDs (optional).
@@ -104,7 +104,7 @@ class ProgramsAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        data = {
+        data = _compact({
             "name": name,
             "description": description,
             "workStatus": work_status,
@@ -112,12 +112,14 @@ class ProgramsAPI:
             "overrideHealthHealth": override_health_health,
             "overrideHealthBy": override_health_by,
             "overrideHealthReason": override_health_reason,
-            "selectedBaselines": selected_baselines or [],
+            "selectedBaselines": list(selected_baselines) if selected_baselines is not None else None,
             "baselineEnabled": baseline_enabled,
             "frameworkVersionMappingId": framework_version_mapping_id,
-            "removedRequirementIds": removed_requirement_ids or [],
-            "updatedRequirementIds": updated_requirement_ids or [],
+            "removedRequirementIds": list(removed_requirement_ids) if removed_requirement_ids is not None else None,
+            "updatedRequirementIds": list(updated_requirement_ids) if updated_requirement_ids is not None else None,
             "cloneProgramName": clone_program_name,
             "isUpdateComplete": is_update_complete
-        }
-        return self.client.patch(self.BASE_URL, f"/{program_id}", data=data, raw=raw)
+        })
+        response = self.client.patch(f"{self._URL_ROOT}{program_id}", data=data, raw=raw)
+        ProgramsAPI.get_program_by_id.cache_evict(self, program_id)
+        return response
@@ -9,22 +9,54 @@
 # The ProofAPI class is responsible for handling interactions with the Proof API,
 # allowing for operations related to proof, such as retrieving and managing proof data.
 
+import asyncio
+import os
 import re
-from .utils import logger
+from .utils import logger, _clean_params, json_dumps, ttl_cache, AsyncAPIClient, submit, filter_users, user_id_set, UPLOAD_CHUNK_SIZE, _BaseAPI
 from .users_api import UsersAPI
 from .labels_api import LabelsAPI
 
-class ProofAPI:
+# Characters that give a label name regular expression meaning in get_proof_by_label
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+def _label_name_matcher(label_name):
+    """
+    Returns a predicate testing whether a label name matches label_name (partial, case-insensitive).
+    Plain names use a casefolded substring test; names containing regular expression syntax are
+    compiled once and searched, as before.
+    """
+    if _REGEX_METACHARACTERS.isdisjoint(label_name):
+        needle = label_name.casefold()
+        return lambda name: needle in name.casefold()
+    return re.compile(label_name, re.IGNORECASE).search
+
+class ProofAPI(_BaseAPI):
     """
     This class handles interactions with the Proof API of Hyperproof.
     """
     BASE_URL = "https://api.hyperproof.app/v1/proof"
-
-    def __init__(self, api_client):
-        # Use the shared API client
-        self.client = api_client
-        self.users_api = UsersAPI(api_client)
-        self.labels_api = LabelsAPI(api_client)
+    _URL_ROOT = BASE_URL + "/"
+    __slots__ = ("_users_api", "_labels_api")
+
+    def __init__(self, api_client, users_api=None, labels_api=None):
+        super().__init__(api_client)
+        # Instances passed in (e.g. the ones a caller already holds) are reused as-is
+        self._users_api = users_api
+        self._labels_api = labels_api
+
+    @property
+    def users_api(self):
+        # Created on first use when none was passed in, so methods such as add_proof never build a UsersAPI
+        if self._users_api is None:
+            self._users_api = UsersAPI(self.client)
+        return self._users_api
+
+    @property
+    def labels_api(self):
+        # Created on first use, like users_api
+        if self._labels_api is None:
+            self._labels_api = LabelsAPI(self.client)
+        return self._labels_api
 
     def get_proof_metadata_collection(self, limit=500, sort_by="uploadedOn", sort_direction="desc", object_type=None, object_id=None, raw=False):
         """
@@ -36,86 +68,315 @@ class ProofAPI:
         :param object_type: Filter by object type (control or label).
         :param object_id: Filter by object ID.
         :param next_token: Token for paginated results (optional, handled internally).
-        :param raw: If True, return raw response text; otherwise return parsed JSON.
+        :param raw: If True, return the proof metadata of all pages as JSON text; otherwise return parsed JSON.
         :return: List of all available proof metadata.
         """
         all_proofs = []
-        next_token = None
-
-        while True:
-            # Prepare the parameters for the API call
-            params = {
-                'limit': limit,
-                'sortBy': sort_by,
-                'sortDirection': sort_direction,
-                'objectType': object_type,
-                'objectId': object_id,
-                'nextToken': next_token
-            }
-
-            # Make the API call
-            response = self.client.get(self.BASE_URL, "/", params=params, raw=False)
 
+        # Prepare the parameters for the API call
+        params = _clean_params(
+            limit=limit,
+            sortBy=sort_by,
+            sortDirection=sort_direction,
+            objectType=object_type,
+            objectId=object_id
+        )
+
+        # Pages are fetched one ahead, following the continuation token (nextToken) until all data is retrieved
+        for response in self._iter_proof_responses(params):
             # Check if the response has data and append to the result
             if not response or 'data' not in response:
                 raise ValueError("No data returned from get_proof_metadata_collection.")
 
             all_proofs.extend(response.get('data', []))
 
-            # Check for the continuation token (nextToken) to determine if more data needs to be fetched
+        # Return all accumulated proofs, as JSON text when raw output is requested
+        return json_dumps(all_proofs).decode('utf-8') if raw else all_proofs
+
+    def iter_proof_metadata(self, limit=500, sort_by="uploadedOn", sort_direction="desc", object_type=None, object_id=None):
+        """
+        Iterate over the proof metadata of an organization, control, label, or task, one proof at a time.
+        Pages are requested only as the caller consumes them and each page is released once iterated,
+        so memory use stays at one page regardless of how many proofs exist.
+
+        :param limit: Maximum number of results to retrieve in a single call (default 500).
+        :param sort_by: Field to sort results by (default is uploadedOn).
+        :param sort_direction: Sort direction (asc or desc, default is desc).
+        :param object_type: Filter by object type (control or label).
+        :param object_id: Filter by object ID.
+        :return: Iterator over proof metadata dicts.
+        """
+        url = self._URL_ROOT
+        next_token = None
+
+        while True:
+            params = _clean_params(
+                limit=limit,
+                sortBy=sort_by,
+                sortDirection=sort_direction,
+                objectType=object_type,
+                objectId=object_id,
+                nextToken=next_token
+            )
+
+            response = self.client.get(url, params=params, raw=False)
+
+            if not response or 'data' not in response:
+                raise ValueError("No data returned from iter_proof_metadata.")
+
+            page = response.get('data', [])
             next_token = response.get('continuationToken', None)
+            response = None
+
+            yield from page
 
-            # If no nextToken is returned, we have retrieved all data
             if not next_token:
                 break
 
-        # Return all accumulated proofs
-        if raw:
-            return all_proofs
+    def iter_proof_metadata_prefetched(self, limit=500, sort_by="uploadedOn", sort_direction="desc", object_type=None, object_id=None):
+        """
+        Iterate over the proof metadata of an organization, control, label, or task, one page at a time.
+        The request for the next page is sent on a worker thread as soon as the current page arrives, so
+        the caller's processing of each page overlaps with the next round-trip. At most two pages are
+        held in memory at once.
 
-        return all_proofs
+        :param limit: Maximum number of results to retrieve in a single call (default 500).
+        :param sort_by: Field to sort results by (default is uploadedOn).
+        :param sort_direction: Sort direction (asc or desc, default is desc).
+        :param object_type: Filter by object type (control or label).
+        :param object_id: Filter by object ID.
+        :return: Iterator yielding lists of proof metadata.
+        """
+        params = _clean_params(
+            limit=limit,
+            sortBy=sort_by,
+            sortDirection=sort_direction,
+            objectType=object_type,
+            objectId=object_id
+        )
+
+        for response in self._iter_proof_responses(params):
+            if not response or 'data' not in response:
+                raise ValueError("No data returned from iter_proof_metadata_prefetched.")
 
+            yield response.get('data', [])
 
+    def _iter_proof_responses(self, params):
+        """
+        Yields each page response of a proof metadata query. The request for the next page is sent on
+        a worker thread before the current response is handed back, so the caller's processing overlaps
+        with the next round-trip. Iteration stops after the last page (no continuationToken) or after a
+        failed request, which is yielded as None.
+
+        :param params: Query parameters of the proof metadata request, without nextToken.
+        :return: Iterator yielding the parsed page responses.
+        """
+        # Bound once, since every page is requested from the same URL
+        get, url = self.client.get, self._URL_ROOT
+
+        def fetch_page(next_token):
+            page_params = _clean_params(**params, nextToken=next_token)
+            return submit(get, url, params=page_params, raw=False)
+
+        pending = fetch_page(None)
+        try:
+            while pending is not None:
+                response = pending.result()
+                pending = None
+
+                # Start fetching the next page before yielding the current one
+                next_token = response.get('continuationToken', None) if isinstance(response, dict) else None
+                if next_token:
+                    pending = fetch_page(next_token)
+
+                yield response
+        finally:
+            # The caller stopped iterating early; drop the request if it has not started yet
+            if pending is not None:
+                pending.cancel()
+
+    async def aget_proof_metadata_collection(self, limit=500, sort_by="uploadedOn", sort_direction="desc", object_type=None, object_id=None):
+        """
+        Asynchronously iterate over the proof metadata of an organization, control, label, or task, one page at a time.
+        The request for the next page is issued before the current page is handed to the caller, so fetching
+        overlaps with the caller's processing of each page.
+
+        Usage: ``async for page in aget_proof_metadata_collection(...): ...``
+
+        :param limit: Maximum number of results to retrieve in a single call (default 500).
+        :param sort_by: Field to sort results by (default is uploadedOn).
+        :param sort_direction: Sort direction (asc or desc, default is desc).
+        :param object_type: Filter by object type (control or label).
+        :param object_id: Filter by object ID.
+        :return: Async iterator yielding lists of proof metadata.
+        """
+        params = _clean_params(
+            limit=limit,
+            sortBy=sort_by,
+            sortDirection=sort_direction,
+            objectType=object_type,
+            objectId=object_id
+        )
+
+        async for response in self._aiter_proof_responses(params):
+            if not response or 'data' not in response:
+                raise ValueError("No data returned from aget_proof_metadata_collection.")
+
+            yield response.get('data', [])
+
+    async def aget_proof_by_user(self, userid=None, givenName=None, surname=None, object_type=None, object_id=None):
+        """
+        Asynchronous variant of get_proof_by_user that yields the matching proofs one page at a time.
+        Several users (or labels, with aget_proof_by_label) can be walked concurrently on one event loop,
+        e.g. with asyncio.gather over collect_all_pages.
+
+        :param userid: The unique identifier of the user (optional).
+        :param givenName: The given name of the user (optional).
+        :param surname: The surname of the user (optional).
+        :param object_type: The object type to filter by (e.g., 'control' or 'label', optional).
+        :param object_id: The object ID to filter by (optional).
+        :return: Async iterator yielding lists of proofs created by the matching user(s).
+        """
+        org_users = await asyncio.to_thread(self.users_api.get_organization_users, raw=False)
+
+        user_ids = user_id_set(filter_users(org_users, userid, givenName, surname))
+        if not user_ids:
+            return
+
+        params = _clean_params(
+            limit=500,
+            sortBy='createdBy',
+            sortDirection='desc',
+            objectType=object_type,
+            objectId=object_id
+        )
+
+        async for response in self._aiter_proof_responses(params):
+            if not response or 'data' not in response:
+                raise ValueError("No data returned from aget_proof_by_user.")
+
+            yield [proof for proof in response.get('data', [])
+                   if isinstance(proof, dict) and proof.get('createdBy') in user_ids]
+
+    async def aget_proof_by_label(self, label_name, limit=500, sort_by="uploadedOn", sort_direction="desc"):
+        """
+        Asynchronous variant of get_proof_by_label that yields the proofs of the label one page at a time.
+
+        :param label_name: The name of the label to search for (partial, case-insensitive match).
+        :param limit: Maximum number of results to retrieve in a single call (default 500).
+        :param sort_by: Field to sort results by (default is uploadedOn).
+        :param sort_direction: Sort direction (asc or desc, default is desc).
+        :return: Async iterator yielding lists of proofs associated with the label.
+        """
+        label_summaries = await asyncio.to_thread(self.labels_api.get_label_summaries, raw=False)
+
+        matches_name = _label_name_matcher(label_name)
+        matching_label = next((label for label in label_summaries or [] if matches_name(label.get('name', ''))), None)
+
+        if not matching_label:
+            raise ValueError(f"No label found with the name: {label_name}")
+
+        params = _clean_params(
+            limit=limit,
+            sortBy=sort_by,
+            sortDirection=sort_direction,
+            objectType='label',
+            objectId=matching_label.get('id')
+        )
+
+        async for response in self._aiter_proof_responses(params):
+            if response is None:
+                # Handle the case where the user doesn't have permission (403)
+                raise PermissionError(f"Access to the label '{label_name}' is forbidden. Please ensure you have joined the label.")
+
+            if 'data' not in response:
+                raise ValueError("No data returned from aget_proof_by_label.")
+
+            yield response.get('data', [])
+
+    async def _aiter_proof_responses(self, params):
+        """
+        Asynchronously yields each page response of a proof metadata query. The request for the next
+        page is issued before the current response is handed back. Iteration stops after the last page
+        (no continuationToken) or after a failed request, which is yielded as None.
+
+        :param params: Query parameters of the proof metadata request, without nextToken.
+        :return: Async iterator yielding the parsed page responses.
+        """
+        # Bound once, since every page is requested from the same URL
+        get, url = AsyncAPIClient(self.client).get, self._URL_ROOT
+
+        def fetch_page(next_token):
+            page_params = _clean_params(**params, nextToken=next_token)
+            return asyncio.ensure_future(get(url, params=page_params, raw=False))
+
+        pending = fetch_page(None)
+        try:
+            while pending is not None:
+                response = await pending
+                pending = None
+
+                # Start fetching the next page before yielding the current one
+                next_token = response.get('continuationToken', None) if isinstance(response, dict) else None
+                if next_token:
+                    pending = fetch_page(next_token)
+
+                yield response
+        finally:
+            # The caller stopped iterating early; do not leave a request running in the background
+            if pending is not None:
+                pending.cancel()
+
+    @ttl_cache(ttl_seconds=120, maxsize=10000)
     def get_proof_metadata(self, proof_id, raw=False):
         """
         Retrieve specific proof metadata by proof ID.
+        Responses are cached for two minutes per ID; new versions added through this class evict the cached entry.
 
         :param proof_id: The unique ID of the proof.
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data of the proof metadata.
         """
-        return self.client.get(self.BASE_URL, f"/{proof_id}", raw=raw)
+        return self.client.get(f"{self._URL_ROOT}{proof_id}", raw=raw)
 
-    def add_proof(self, file_path, object_id=None, object_type=None, raw=False):
+    def add_proof(self, file_path, object_id=None, object_type=None, raw=False, chunk_size=UPLOAD_CHUNK_SIZE, progress_callback=None):
         """
-        Upload a new proof file to the organization.
+        Upload a new proof file to the organization. The file is streamed from disk, so large files are not loaded into memory.
 
         :param file_path: Path to the proof file to upload.
         :param object_id: The object ID the proof is related to (optional).
         :param object_type: The object type (control or label, optional).
         :param raw: If True, return raw response text; otherwise return parsed JSON.
+        :param chunk_size: Number of bytes sent per read while uploading (default 64 KiB).
+        :param progress_callback: Optional callable receiving a MultipartEncoderMonitor (bytes_read, len) as the upload progresses.
         :return: Response data of the newly added proof.
         """
         with open(file_path, 'rb') as file:
-            files = {'file': file}
+            files = {'file': (os.path.basename(file_path), file)}
             data = {}
             if object_id and object_type:
                 data['objectId'] = object_id
                 data['objectType'] = object_type
-            return self.client.post(self.BASE_URL, "/", files=files, data=data, raw=raw)
+            return self.client.post(self._URL_ROOT, files=files, data=data, raw=raw,
+                                    chunk_size=chunk_size, progress_callback=progress_callback)
 
-    def add_proof_version(self, proof_id, file_path, raw=False):
+    def add_proof_version(self, proof_id, file_path, raw=False, chunk_size=UPLOAD_CHUNK_SIZE, progress_callback=None):
         """
-        Add a new version of an existing proof by proof ID.
+        Add a new version of an existing proof by proof ID. The file is streamed from disk, so large files are not loaded into memory.
 
         :param proof_id: The ID of the proof to update.
         :param file_path: Path to the new version of the proof file.
         :param raw: If True, return raw response text; otherwise return parsed JSON.
+        :param chunk_size: Number of bytes sent per read while uploading (default 64 KiB).
+        :param progress_callback: Optional callable receiving a MultipartEncoderMonitor (bytes_read, len) as the upload progresses.
         :return: Response data of the updated proof.
         """
         with open(file_path, 'rb') as file:
-            files = {'file': file}
-            return self.client.post(self.BASE_URL, f"/{proof_id}/versions", files=files, raw=raw)
+            files = {'file': (os.path.basename(file_path), file)}
+            response = self.client.post(f"{self._URL_ROOT}{proof_id}/versions", files=files, raw=raw,
+                                        chunk_size=chunk_size, progress_callback=progress_callback)
+        ProofAPI.get_proof_metadata.cache_evict(self, proof_id)
+        return response
 
     def get_proof_contents(self, proof_id, version=None, raw=False):
         """
@@ -126,10 +387,8 @@ class ProofAPI:
         :param raw: If True, return raw response.
         :return: The contents of the proof file.
         """
-        params = {}
-        if version:
-            params['version'] = version
-        return self.client.get(self.BASE_URL, f"/{proof_id}/contents", params=params, raw=raw)
+        params = _clean_params(version=version)
+        return self.client.get(f"{self._URL_ROOT}{proof_id}/contents", params=params, raw=raw)
 
     def get_proof_by_user(self, userid=None, givenName=None, surname=None, object_type=None, object_id=None, raw=False):
         """
@@ -141,76 +400,102 @@ class ProofAPI:
         :param surname: The surname of the user (optional).
         :param object_type: The object type to filter by (e.g., 'control' or 'label', optional).
         :param object_id: The object ID to filter by (optional).
-        :param raw: If True, return raw response; otherwise return parsed JSON.
+        :param raw: If True, return the matching proofs as JSON text; otherwise return parsed JSON.
         :return: List of proofs associated with the specified user(s) and object_type or object_id.
         """
+        user_proofs = list(self.iter_proof_by_user(userid=userid, givenName=givenName, surname=surname,
+                                                   object_type=object_type, object_id=object_id))
+
+        # The raw form is the JSON text of the matching proofs, built from the pages already fetched
+        return json_dumps(user_proofs).decode('utf-8') if raw else user_proofs
+
+    def iter_proof_by_user(self, userid=None, givenName=None, surname=None, object_type=None, object_id=None):
+        """
+        Iterate over the proofs associated with a user based on userid, givenName, surname, object_type, and object_id.
+        Proofs are yielded as each page arrives, so processing can start before the last page is fetched and
+        memory use stays at one page.
+
+        :param userid: The unique identifier of the user (optional).
+        :param givenName: The given name of the user (optional).
+        :param surname: The surname of the user (optional).
+        :param object_type: The object type to filter by (e.g., 'control' or 'label', optional).
+        :param object_id: The object ID to filter by (optional).
+        :return: Iterator over the proofs created by the specified user(s).
+        """
         # Get all organization users
         org_users = self.users_api.get_organization_users(raw=False)
 
-        if raw:
-            return org_users
-
         # Filter users based on userid, givenName, and surname
-        filtered_users = []
-        for user in org_users:
-            if userid and (user.get('id') == userid or user.get('userId') == userid):
-                filtered_users.append(user)
-            elif givenName and surname:
-                if user.get('givenName') == givenName and user.get('surname') == surname:
-                    filtered_users.append(user)
-            elif givenName and user.get('givenName') == givenName:
-                filtered_users.append(user)
-            elif surname and user.get('surname') == surname:
-                filtered_users.append(user)
+        filtered_users = filter_users(org_users, userid=userid, givenName=givenName, surname=surname)
 
         if not filtered_users:
-            return []
-
-        # Fetch proofs with optional object_type and object_id filtering
-        limit = 500
-        next_token = None
-        all_proofs = []
+            return
 
-        while True:
-            # Prepare the parameters for fetching proofs
-            params = {
-                'limit': limit,
-                'sortBy': 'createdBy',
-                'sortDirection': 'desc',
-                'objectType': object_type,
-                'objectId': object_id,
-                'nextToken': next_token
-            }
-
-            all_proofs_response = self.client.get(self.BASE_URL, '/', params=params, raw=False)
+        # Index the matching users by id once, so each proof is checked with a single set lookup
+        user_ids = user_id_set(filtered_users)
 
-            if not all_proofs_response or 'data' not in all_proofs_response:
-                raise ValueError("No data returned from get_proof_metadata_collection.")
+        yield from self._iter_proofs_created_by(user_ids, object_type, object_id)
 
-            # Extend the list with data from the current response
-            all_proofs.extend(all_proofs_response.get('data', []))
+    def get_proofs_by_users(self, users, object_type=None, object_id=None):
+        """
+        Retrieve the proofs created by each of several users with a single paginated walk, instead of one
+        walk per user as with repeated get_proof_by_user calls.
 
-            # Check for continuationToken to determine if more results exist
-            next_token = all_proofs_response.get('continuationToken', None)
+        :param users: List of user records, as returned by get_organization_users.
+        :param object_type: The object type to filter by (e.g., 'control' or 'label', optional).
+        :param object_id: The object ID to filter by (optional).
+        :return: Dict mapping each user's `id` (or `userId` when it has no `id`) to the list of proofs they created.
+        """
+        # Map both identifiers of every user to the key of that user's bucket
+        user_proofs = {}
+        bucket_keys = {}
+        for user in users or []:
+            key = user.get('id') or user.get('userId')
+            if not key:
+                continue
+            user_proofs.setdefault(key, [])
+            for user_id in (user.get('id'), user.get('userId')):
+                if user_id:
+                    bucket_keys[user_id] = key
+
+        if not bucket_keys:
+            return user_proofs
+
+        for proof in self._iter_proofs_created_by(bucket_keys, object_type, object_id):
+            user_proofs[bucket_keys[proof['createdBy']]].append(proof)
 
-            # If no continuationToken is returned, all results have been fetched
-            if not next_token:
-                break
+        return user_proofs
 
-        # Filter the returned proofs based on the createdBy field matching the filtered users
-        user_proofs = []
-        for proof in all_proofs:
-            if isinstance(proof, dict):
-                created_by = proof.get('createdBy', None)
+    def _iter_proofs_created_by(self, user_ids, object_type, object_id):
+        """
+        Yields the proofs whose createdBy field is one of user_ids, as each page arrives.
 
-                # Match the 'createdBy' field with the filtered users
-                for user in filtered_users:
-                    if created_by == user.get('id') or created_by == user.get('userId'):
-                        user_proofs.append(proof)
-            else:
-                print(f"Unexpected type for proof: {type(proof)}")
+        :param user_ids: The user identifiers to match, as a set or a dict keyed by identifier.
+        :param object_type: The object type to filter by (optional).
+        :param object_id: The object ID to filter by (optional).
+        :return: Iterator over the matching proofs.
+        """
+        # Prepare the parameters for fetching proofs
+        params = _clean_params(
+            limit=500,
+            sortBy='createdBy',
+            sortDirection='desc',
+            objectType=object_type,
+            objectId=object_id
+        )
+
+        # Pages are fetched one ahead until no continuationToken is returned
+        for all_proofs_response in self._iter_proof_responses(params):
+            if not all_proofs_response or 'data' not in all_proofs_response:
+                raise ValueError("No data returned from get_proof_metadata_collection.")
 
-        return user_proofs
+            # Yield the proofs whose createdBy field matches the filtered users
+            for proof in all_proofs_response.get('data', []):
+                if isinstance(proof, dict):
+                    if proof.get('createdBy') in user_ids:
+                        yield proof
+                else:
+                    logger.warning(f"Unexpected type for proof: {type(proof)}")
 
     def get_proof_by_label(self, label_name, limit=500, sort_by="uploadedOn", sort_direction="desc", raw=False):
         """
@@ -220,38 +505,48 @@ class ProofAPI:
         :param limit: Maximum number of results to retrieve in a single call (default 500).
         :param sort_by: Field to sort results by (default is uploadedOn).
         :param sort_direction: Sort direction (asc or desc, default is desc).
-        :param raw: If True, return raw response text; otherwise return parsed JSON.
+        :param raw: If True, return the proofs of all pages as JSON text; otherwise return parsed JSON.
         :return: List of proofs associated with the specified label.
         """
+        all_proofs = list(self.iter_proof_by_label(label_name, limit=limit, sort_by=sort_by, sort_direction=sort_direction))
+
+        # The raw form is the JSON text of every page's proofs, built from the data already fetched
+        return json_dumps(all_proofs).decode('utf-8') if raw else all_proofs
+
+    def iter_proof_by_label(self, label_name, limit=500, sort_by="uploadedOn", sort_direction="desc"):
+        """
+        Iterate over the proofs associated with a specific label by label name (partial, case-insensitive match).
+        Proofs are yielded as each page arrives, so memory use stays at one page.
+
+        :param label_name: The name of the label to search for (partial, case-insensitive match).
+        :param limit: Maximum number of results to retrieve in a single call (default 500).
+        :param sort_by: Field to sort results by (default is uploadedOn).
+        :param sort_direction: Sort direction (asc or desc, default is desc).
+        :return: Iterator over the proofs associated with the specified label.
+        """
         # Get label summaries and perform a case-insensitive partial match on the given name
         label_summaries = self.labels_api.get_label_summaries(raw=False)
 
         # Perform case-insensitive partial match on label name
-        matching_label = next((label for label in label_summaries if re.search(label_name, label.get('name', ''), re.IGNORECASE)), None)
+        matches_name = _label_name_matcher(label_name)
+        matching_label = next((label for label in label_summaries or [] if matches_name(label.get('name', ''))), None)
 
         if not matching_label:
             raise ValueError(f"No label found with the name: {label_name}")
 
         label_id = matching_label.get('id')
 
-        # Fetch proofs associated with the label using its ID
-        all_proofs = []
-        next_token = None
-
-        while True:
-            # Prepare parameters for fetching proofs
-            params = {
-                'limit': limit,
-                'sortBy': sort_by,
-                'sortDirection': sort_direction,
-                'objectType': 'label',
-                'objectId': label_id,
-                'nextToken': next_token
-            }
-
-            # Make the API request and handle errors via the core _handle_response method
-            response = self.client.get(self.BASE_URL, "/", params=params, raw=False)
-            
+        # Prepare parameters for fetching proofs associated with the label using its ID
+        params = _clean_params(
+            limit=limit,
+            sortBy=sort_by,
+            sortDirection=sort_direction,
+            objectType='label',
+            objectId=label_id
+        )
+
+        # Pages are fetched one ahead until no continuationToken is returned
+        for response in self._iter_proof_responses(params):
             if response is None:
                 # Handle the case where the user doesn't have permission (403)
                 raise PermissionError(f"Access to the label '{label_name}' is forbidden. Please ensure you have joined the label.")
@@ -259,11 +554,4 @@ class ProofAPI:
             if 'data' not in response:
                 raise ValueError("No data returned from get_proof_metadata_collection.")
 
-            all_proofs.extend(response.get('data', []))
-
-            # Check for continuationToken to fetch more data if available
-            next_token = response.get('continuationToken', None)
-            if not next_token:
-                break
-
-        return all_proofs if not raw else response
+            yield from response.get('data', [])
@@ -9,20 +9,34 @@
 # The RisksAPI class is responsible for handling interactions with the Risks API,
 # allowing for operations such as retrieving, adding, filtering, and updating risks within an organization.
 
-from .utils import logger
+from itertools import chain
+from .utils import logger, _clean_params, _compact, _CLEAR, _as_list, json_dumps, submit, filter_users, user_id_set, _BaseAPI
 from .users_api import UsersAPI
 
-class RisksAPI:
+class RisksAPI(_BaseAPI):
     """
     This class handles interactions with the Risks API of Hyperproof.
     It allows retrieving, adding, filtering, and updating risks in an organization.
     """
     BASE_URL = "https://api.hyperproof.app/v1/risks"
+    _URL_ROOT = BASE_URL + "/"
+    _URL_FILTER = BASE_URL + "/filter"
 
-    def __init__(self, api_client):
-        # Use the shared API client
-        self.client = api_client
-        self.users_api = UsersAPI(api_client)
+    # Maximum number of risk IDs sent in a single filter request
+    FILTER_BATCH_SIZE = 100
+    __slots__ = ("_users_api",)
+
+    def __init__(self, api_client, users_api=None):
+        super().__init__(api_client)
+        # An instance passed in (e.g. one the caller already holds) is reused as-is
+        self._users_api = users_api
+
+    @property
+    def users_api(self):
+        # Created on first use when none was passed in
+        if self._users_api is None:
+            self._users_api = UsersAPI(self.client)
+        return self._users_api
 
     def get_risks(self, risk_register_id=None, status=None, raw=False):
         """
@@ -33,11 +47,11 @@ class RisksAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        params = {
-            'riskRegisterId': risk_register_id,
-            'status': status
-        }
-        return self.client.get(self.BASE_URL, "/", params=params, raw=raw)
+        params = _clean_params(
+            riskRegisterId=risk_register_id,
+            status=status
+        )
+        return self.client.get(self._URL_ROOT, params=params, raw=raw)
 
     def add_risk(self, risk_register_id, risk_identifier, name, description, category, response,
                  likelihood_level, likelihood_rationale, impact_level, impact_rationale,
@@ -61,7 +75,7 @@ class RisksAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        data = {
+        data = _compact({
             "riskRegisterId": risk_register_id,
             "riskIdentifier": risk_identifier,
             "name": name,
@@ -75,8 +89,8 @@ class RisksAPI:
             "toleranceLevel": tolerance_level,
             "ownerId": owner_id,
             "customFields": custom_fields or []
-        }
-        return self.client.post(self.BASE_URL, "/", data=data, raw=raw)
+        })
+        return self.client.post(self._URL_ROOT, data=data, raw=raw)
 
     def get_risk_by_id(self, risk_id, raw=False):
         """
@@ -86,7 +100,7 @@ class RisksAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.get(self.BASE_URL, f"/{risk_id}", raw=raw)
+        return self.client.get(f"{self._URL_ROOT}{risk_id}", raw=raw)
 
     def update_risk(self, risk_id, name=None, description=None, category=None, response=None,
                     likelihood_level=None, likelihood_rationale=None, impact_level=None,
@@ -95,6 +109,7 @@ class RisksAPI:
                     clear_impact_level=False, clear_tolerance_level=False, raw=False):
         """
         Updates an existing risk with new values, with support for clearing certain fields.
+        Only the fields that are given (or cleared) are sent, so the others keep their values.
 
         :param risk_id: The unique ID of the risk.
         :param name: Updated name of the risk (optional).
@@ -116,38 +131,82 @@ class RisksAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        data = {
+        data = _compact({
             "name": name,
             "description": description,
-            "category": None if clear_category else category,
+            "category": _CLEAR if clear_category else category,
             "response": response,
-            "likelihoodLevel": None if clear_likelihood_level else likelihood_level,
+            "likelihoodLevel": _CLEAR if clear_likelihood_level else likelihood_level,
             "likelihoodRationale": likelihood_rationale,
-            "impactLevel": None if clear_impact_level else impact_level,
+            "impactLevel": _CLEAR if clear_impact_level else impact_level,
             "impactRationale": impact_rationale,
-            "toleranceLevel": None if clear_tolerance_level else tolerance_level,
+            "toleranceLevel": _CLEAR if clear_tolerance_level else tolerance_level,
             "status": status,
             "ownerId": owner_id,
-            "customFields": custom_fields or []
-        }
-        return self.client.patch(self.BASE_URL, f"/{risk_id}", data=data, raw=raw)
+            "customFields": custom_fields
+        })
+        return self.client.patch(f"{self._URL_ROOT}{risk_id}", data=data, raw=raw)
 
-    def filter_risks(self, risk_ids=None, modified_after=None, status=None, raw=False):
+    def filter_risks(self, risk_ids=None, modified_after=None, status=None, raw=False, yield_pages=False):
         """
         Filters risks based on a set of criteria like risk IDs, modification date, and status.
+        Duplicate risk IDs are dropped, and more than FILTER_BATCH_SIZE IDs are split into
+        several filter requests that are sent concurrently and merged in order.
 
-        :param risk_ids: List of risk IDs to filter by (optional).
+        :param risk_ids: A risk ID, or a list of risk IDs, to filter by (optional).
         :param modified_after: Only return risks modified after this date (optional).
         :param status: Filter by risk status (optional).
         :param raw: If True, return raw response text; otherwise return parsed JSON.
+        :param yield_pages: If True, return an iterator over the parsed risks of each batch instead of one list.
+                            The iterator raises ValueError when a batch request fails.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        data = {
-            "riskIds": risk_ids or [],
-            "modifiedAfter": modified_after,
-            "status": status
-        }
-        return self.client.put(self.BASE_URL, "/filter", data=data, raw=raw)
+        risk_ids = list(dict.fromkeys(_as_list(risk_ids)))
+        batch_size = self.FILTER_BATCH_SIZE
+
+        if len(risk_ids) <= batch_size and not yield_pages:
+            return self._filter_risks(risk_ids, modified_after, status, raw=raw)
+
+        batches = [risk_ids[start:start + batch_size] for start in range(0, len(risk_ids), batch_size)] or [[]]
+        futures = [submit(self._filter_risks, batch, modified_after, status) for batch in batches]
+        if yield_pages:
+            return self._iter_pages(futures)
+
+        pages = [future.result() for future in futures]
+        if any(page is None for page in pages):
+            # At least one batch failed; the error has already been logged by the client
+            return None
+
+        risks = list(chain.from_iterable(pages))
+        return json_dumps(risks).decode('utf-8') if raw else risks
+
+    def _iter_pages(self, futures):
+        """
+        Yields the parsed risks of each batch request in order, raising ValueError on a failed batch
+        instead of handing back None.
+        """
+        try:
+            for future in futures:
+                page = future.result()
+                if page is None:
+                    # The client has already logged the failed request
+                    raise ValueError("No data returned from filter_risks.")
+                yield page
+        finally:
+            # The caller stopped iterating early; drop the requests that have not started yet
+            for future in futures:
+                future.cancel()
+
+    def _filter_risks(self, risk_ids, modified_after, status, raw=False):
+        """
+        Sends a single filter request for one batch of risk IDs.
+        """
+        data = _clean_params(
+            riskIds=risk_ids,
+            modifiedAfter=modified_after,
+            status=status
+        )
+        return self.client.put(self._URL_FILTER, data=data, raw=raw)
 
     def get_risks_by_user(self, userid=None, givenName=None, surname=None, raw=False):
         """
@@ -156,38 +215,25 @@ class RisksAPI:
         :param userid: The unique identifier of the user (optional).
         :param givenName: The given name of the user (optional).
         :param surname: The surname of the user (optional).
-        :param raw: If True, return raw response; otherwise return parsed JSON.
+        :param raw: If True, return the matching risks as JSON text; otherwise return parsed JSON.
         :return: List of risks associated with the specified user(s).
         """
-        # Get all organization users
+        # Fetch the risks alongside the organization users, as the two requests are independent
+        risks_future = submit(self.get_risks, raw=False)
         org_users = self.users_api.get_organization_users(raw=False)
 
-        filtered_users = []
-        for user in org_users:
-            if userid and (user.get('id') == userid or user.get('userId') == userid):
-                filtered_users.append(user)
-            elif givenName and surname:
-                if user.get('givenName') == givenName and user.get('surname') == surname:
-                    filtered_users.append(user)
-            elif givenName and user.get('givenName') == givenName:
-                filtered_users.append(user)
-            elif surname and user.get('surname') == surname:
-                filtered_users.append(user)
+        filtered_users = filter_users(org_users, userid=userid, givenName=givenName, surname=surname)
 
         if not filtered_users:
-            return [] if not raw else self.client.get(self.BASE_URL, "/", raw=True)
-
-        all_risks = self.get_risks(raw=False)
-
-        user_risks = []
-        for risk in all_risks:
-            owner_id = risk.get('ownerId')
-            for user in filtered_users:
-                if owner_id == user.get('id') or owner_id == user.get('userId'):
-                    user_risks.append(risk)
-                    break
-
-        if raw:
-            return self.client.get(self.BASE_URL, "/", raw=True)
-        else:
-            return user_risks
+            # Nothing can match, so the risk list is not needed
+            risks_future.cancel()
+            return '[]' if raw else []
+
+        # Index the matching users by id once, so each risk is checked with a single set lookup
+        owner_ids = user_id_set(filtered_users)
+
+        all_risks = risks_future.result()
+        user_risks = [risk for risk in all_risks or [] if risk.get('ownerId') in owner_ids]
+
+        # The raw form is the JSON text of the matching risks, built from the data already fetched
+        return json_dumps(user_risks).decode('utf-8') if raw else user_risks
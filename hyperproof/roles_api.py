@@ -9,24 +9,26 @@
 # The RolesAPI class is responsible for handling interactions with the Roles API,
 # allowing for operations such as retrieving a list of roles in the organization.
 
-from .utils import logger
+from .utils import logger, ttl_cache, _BaseAPI
 
-class RolesAPI:
+class RolesAPI(_BaseAPI):
     """
     This class handles interactions with the Roles API of Hyperproof.
     It allows retrieving a list of roles in the organization.
     """
     BASE_URL = "https://api.hyperproof.app/v1/roles"
+    _URL_ROOT = BASE_URL + "/"
+    __slots__ = ()
 
-    def __init__(self, api_client):
-        # Use the shared API client
-        self.client = api_client
-
+    @ttl_cache(ttl_seconds=300, maxsize=4, stale_on_error=True)
     def get_roles(self, raw=False):
         """
         Retrieves a list of roles in the organization.
 
+        Responses are cached for five minutes; call hyperproof.clear_cache() to force a refresh.
+        If the API cannot be reached, the last cached response is returned instead.
+
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.get(self.BASE_URL, "/", raw=raw)
+        return self.client.get(self._URL_ROOT, raw=raw)
@@ -1,22 +1,25 @@
 # hyperproof/task_statuses_api.py
 # from .utils import APIClient
+from .utils import ttl_cache, _BaseAPI
 
-class TaskStatusesAPI:
+class TaskStatusesAPI(_BaseAPI):
     """
     This class handles interactions with the Task Statuses API of Hyperproof.
     It allows retrieving the task status values in an organization.
     """
     BASE_URL = "https://api.hyperproof.app/v1/taskstatuses"
+    _URL_ROOT = BASE_URL + "/"
+    __slots__ = ()
 
-    def __init__(self, api_client):
-        # Initialize the API client with authentication
-        self.client = api_client
-
+    @ttl_cache(ttl_seconds=300, maxsize=4, stale_on_error=True)
     def get_task_statuses(self, raw=False):
         """
         Retrieves the task statuses in an organization.
 
+        Responses are cached for five minutes; call hyperproof.clear_cache() to force a refresh.
+        If the API cannot be reached, the last cached response is returned instead.
+
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.get(self.BASE_URL, "/", raw=raw)
+        return self.client.get(self._URL_ROOT, raw=raw)
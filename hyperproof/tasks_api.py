@@ -9,22 +9,44 @@
 # The TasksAPI class is responsible for handling interactions with the Tasks API,
 # allowing for operations such as creating, retrieving, updating tasks, and handling task-related proofs.
 
+import os
+from itertools import chain
 from .users_api import UsersAPI
-from .utils import logger
+from .utils import logger, _compact, _as_list, json_dumps, submit, filter_users, UPLOAD_CHUNK_SIZE, _BaseAPI
 from .task_statuses_api import TaskStatusesAPI
 
-class TasksAPI:
+class TasksAPI(_BaseAPI):
     """
     This class handles interactions with the Tasks API of Hyperproof.
     It allows for creating, retrieving, updating tasks, and handling task-related proofs.
     """
     BASE_URL = "https://api.hyperproof.app/v1/tasks"
+    _URL_ROOT = BASE_URL + "/"
+    _URL_FILTER = BASE_URL + "/filter"
+
+    # Maximum number of assignee IDs sent in a single filter request
+    FILTER_BATCH_SIZE = 100
+    __slots__ = ("_users_api", "_task_statuses_api")
     
-    def __init__(self, api_client):
-        # Use the shared API client
-        self.client = api_client
-        self.users_api = UsersAPI(api_client)
-        self.task_statuses_api = TaskStatusesAPI(api_client)
+    def __init__(self, api_client, users_api=None, task_statuses_api=None):
+        super().__init__(api_client)
+        # Instances passed in (e.g. the ones a caller already holds) are reused as-is
+        self._users_api = users_api
+        self._task_statuses_api = task_statuses_api
+
+    @property
+    def users_api(self):
+        # Created on first use when none was passed in
+        if self._users_api is None:
+            self._users_api = UsersAPI(self.client)
+        return self._users_api
+
+    @property
+    def task_statuses_api(self):
+        # Created on first use, like users_api
+        if self._task_statuses_api is None:
+            self._task_statuses_api = TaskStatusesAPI(self.client)
+        return self._task_statuses_api
      
     def add_task(self, title, target_object, description, assignee_id, priority, due_date, has_integration=False, raw=False):
         """
@@ -49,7 +71,7 @@ class TasksAPI:
             "dueDate": due_date,
             "hasIntegration": has_integration
         }
-        return self.client.post(self.BASE_URL, "/", data=data, raw=raw)
+        return self.client.post(self._URL_ROOT, data=data, raw=raw)
 
     def get_task_by_id(self, task_id, raw=False):
         """
@@ -59,9 +81,9 @@ class TasksAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        logger.debug(f"Getting task by ID: {task_id}")
-        response = self.client.get(self.BASE_URL, f"/{task_id}", raw=raw)
-        logger.debug(f"Get task response: {response}")
+        logger.debug("Getting task by ID: %s", task_id)
+        response = self.client.get(f"{self._URL_ROOT}{task_id}", raw=raw)
+        logger.debug("Get task response: %s", response)
         return response
 
     def update_task(self, task_id, title=None, description=None, assignee_id=None, target_id=None, target_type=None,
@@ -82,7 +104,7 @@ class TasksAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        data = {
+        data = _compact({
             "title": title,
             "description": description,
             "assigneeId": assignee_id,
@@ -92,13 +114,14 @@ class TasksAPI:
             "priority": priority,
             "sortOrder": sort_order,
             "dueDate": due_date
-        }
-        return self.client.patch(self.BASE_URL, f"/{task_id}", data=data, raw=raw)
+        })
+        return self.client.patch(f"{self._URL_ROOT}{task_id}", data=data, raw=raw)
 
     def add_task_proof(self, task_id, file_path, proof_owned_by=None, proof_source=None, proof_source_id=None,
-                       proof_source_file_id=None, proof_source_modified_on=None, proof_live_sync_enabled=False, raw=False):
+                       proof_source_file_id=None, proof_source_modified_on=None, proof_live_sync_enabled=False, raw=False,
+                       chunk_size=UPLOAD_CHUNK_SIZE, progress_callback=None):
         """
-        Adds a proof item to a task.
+        Adds a proof item to a task. The file is streamed from disk, so large files are not loaded into memory.
 
         :param task_id: The unique ID of the task.
         :param file_path: Path to the proof file to upload.
@@ -109,10 +132,12 @@ class TasksAPI:
         :param proof_source_modified_on: Date and time the proof was modified (ISO 8601 format, optional).
         :param proof_live_sync_enabled: Whether live sync is enabled for the proof (optional, default is False).
         :param raw: If True, return raw response text; otherwise return parsed JSON.
+        :param chunk_size: Number of bytes sent per read while uploading (default 64 KiB).
+        :param progress_callback: Optional callable receiving a MultipartEncoderMonitor (bytes_read, len) as the upload progresses.
         :return: Response data in the desired format (raw or parsed JSON).
         """
         with open(file_path, 'rb') as file:
-            files = {'proof': file}
+            files = {'proof': (os.path.basename(file_path), file)}
             data = {
                 "hp-proof-owned-by": proof_owned_by,
                 "hp-proof-source": proof_source,
@@ -121,7 +146,8 @@ class TasksAPI:
                 "hp-proof-source-modified-on": proof_source_modified_on,
                 "hp-proof-live-sync-enabled": proof_live_sync_enabled
             }
-            return self.client.post(self.BASE_URL, f"/{task_id}/proof", files=files, data=data, raw=raw)
+            return self.client.post(f"{self._URL_ROOT}{task_id}/proof", files=files, data=data, raw=raw,
+                                    chunk_size=chunk_size, progress_callback=progress_callback)
 
     def get_task_proof_metadata(self, task_id, raw=False):
         """
@@ -131,11 +157,14 @@ class TasksAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.get(self.BASE_URL, f"/{task_id}/proof", raw=raw)
+        return self.client.get(f"{self._URL_ROOT}{task_id}/proof", raw=raw)
 
-    def filter_tasks(self, target_object_type=None, target_object_ids=None, task_ids=None, assignee_ids=None, assignee_id=None, modified_after=None, raw=False):
+    def filter_tasks(self, target_object_type=None, target_object_ids=None, task_ids=None, assignee_ids=None, assignee_id=None, modified_after=None, raw=False,
+                     task_status_ids=None, task_status_id=None):
         """
-        Gets the set of tasks matching the supplied filter.
+        Gets the set of tasks matching the supplied filter. Duplicate assignee IDs are dropped, and more
+        than FILTER_BATCH_SIZE assignees are split into several filter requests that are sent concurrently
+        and merged in order.
 
         :param target_object_type: Type of the target object (optional).
         :param target_object_ids: List of target object IDs to filter by (optional).
@@ -144,43 +173,46 @@ class TasksAPI:
         :param assignee_id: Single assignee ID to filter by (optional).
         :param modified_after: Return tasks modified after this date (ISO 8601 format, optional).
         :param raw: If True, return raw response text; otherwise return parsed JSON.
+        :param task_status_ids: List of task status IDs to filter by (optional).
+        :param task_status_id: Single task status ID to filter by (optional).
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        data = {}
-
-        # Ensure target_object_type is added if provided
-        if target_object_type:
-            data["targetObjectType"] = target_object_type
-
-        # Convert single values to lists for target_object_ids and task_ids
-        if target_object_ids:
-            data["targetObjectIds"] = target_object_ids if isinstance(target_object_ids, list) else [target_object_ids]
-        
-        if task_ids:
-            data["taskIds"] = task_ids if isinstance(task_ids, list) else [task_ids]
-
-        # Conflate assignee_ids and assignee_id into one list
-        if assignee_ids and not isinstance(assignee_ids, list):
-            assignee_ids = [assignee_ids]
-        
-        if assignee_id:
-            if not assignee_ids:
-                assignee_ids = [assignee_id]
-            else:
-                assignee_ids.append(assignee_id)
-
+        # assignee_ids and assignee_id are conflated into one list
+        assignee_ids = list(dict.fromkeys(_as_list(assignee_ids) + _as_list(assignee_id)))
+        data = _compact({
+            "targetObjectType": target_object_type,
+            "targetObjectIds": _as_list(target_object_ids) or None,
+            "taskIds": _as_list(task_ids) or None,
+            "modifiedAfter": modified_after,
+            "taskStatusIds": (_as_list(task_status_ids) + _as_list(task_status_id)) or None
+        })
+        batch_size = self.FILTER_BATCH_SIZE
+
+        if len(assignee_ids) <= batch_size:
+            return self._filter_tasks(data, assignee_ids, raw=raw)
+
+        batches = [assignee_ids[start:start + batch_size] for start in range(0, len(assignee_ids), batch_size)]
+        futures = [submit(self._filter_tasks, data, batch) for batch in batches]
+        pages = [future.result() for future in futures]
+        if any(page is None for page in pages):
+            # At least one batch failed; the error has already been logged by the client
+            return None
+
+        tasks = list(chain.from_iterable(pages))
+        return json_dumps(tasks).decode('utf-8') if raw else tasks
+
+    def _filter_tasks(self, data, assignee_ids, raw=False):
+        """
+        Sends a single filter request for one batch of assignee IDs.
+        """
         if assignee_ids:
-            data["assigneeIds"] = assignee_ids
-
-        # Add modifiedAfter if provided
-        if modified_after:
-            data["modifiedAfter"] = modified_after
+            data = {**data, "assigneeIds": assignee_ids}
 
-        logger.debug(f"Filter data: {data}")
+        logger.debug("Filter data: %s", data)
         
         # Send the PUT request with the constructed filter data
-        response = self.client.put(self.BASE_URL, "/filter", data=data, raw=raw)
-        logger.debug(f"Filter tasks response: {response}")
+        response = self.client.put(self._URL_FILTER, data=data, raw=raw)
+        logger.debug("Filter tasks response: %s", response)
         
         return response
 
@@ -193,7 +225,7 @@ class TasksAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.get(self.BASE_URL, f"/{task_id}/comments", raw=raw)
+        return self.client.get(f"{self._URL_ROOT}{task_id}/comments", raw=raw)
 
     def add_task_comment(self, task_id, comment_text_formatted, is_internal_comment=False, object_type="task", object_id=None, raw=False):
         """
@@ -207,13 +239,13 @@ class TasksAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        data = {
+        data = _compact({
             "commentTextFormatted": comment_text_formatted,
             "isInternalComment": is_internal_comment,
             "objectType": object_type,
             "objectId": object_id
-        }
-        return self.client.post(self.BASE_URL, f"/{task_id}/comments", data=data, raw=raw)
+        })
+        return self.client.post(f"{self._URL_ROOT}{task_id}/comments", data=data, raw=raw)
 
     def update_task_comment(self, task_id, comment_id, comment_text_formatted=None, is_internal_comment=None, object_type="task", object_id=None, raw=False):
         """
@@ -228,13 +260,13 @@ class TasksAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        data = {
+        data = _compact({
             "commentTextFormatted": comment_text_formatted,
             "isInternalComment": is_internal_comment,
             "objectType": object_type,
             "objectId": object_id
-        }
-        return self.client.patch(self.BASE_URL, f"/{task_id}/comments/{comment_id}", data=data, raw=raw)
+        })
+        return self.client.patch(f"{self._URL_ROOT}{task_id}/comments/{comment_id}", data=data, raw=raw)
 
     def delete_task_comment(self, task_id, comment_id, raw=False):
         """
@@ -245,109 +277,114 @@ class TasksAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        return self.client.delete(self.BASE_URL, f"/{task_id}/comments/{comment_id}", raw=raw)
+        return self.client.delete(f"{self._URL_ROOT}{task_id}/comments/{comment_id}", raw=raw)
     
     def get_tasks_by_user(self, user_id=None, first_name=None, surname=None):
-        logger.debug(f"Getting tasks by user. User ID: {user_id}, First Name: {first_name}, Surname: {surname}")
+        logger.debug("Getting tasks by user. User ID: %s, First Name: %s, Surname: %s", user_id, first_name, surname)
         users = self.users_api.get_organization_users()
-        logger.debug(f"Retrieved {len(users)} users")
-
-        filtered_users = []
-        for user in users:
-            if user_id and user.get('userId') == user_id:
-                filtered_users.append(user)
-            elif first_name and surname:
-                if user.get('givenName') == first_name and user.get('surname') == surname:
-                    filtered_users.append(user)
-            elif first_name and user.get('givenName') == first_name:
-                filtered_users.append(user)
-            elif surname and user.get('surname') == surname:
-                filtered_users.append(user)
-
-        logger.debug(f"Filtered {len(filtered_users)} users")
+        logger.debug("Retrieved %s users", len(users))
+
+        filtered_users = filter_users(users, userid=user_id, givenName=first_name, surname=surname)
+
+        logger.debug("Filtered %s users", len(filtered_users))
 
         if not filtered_users:
             logger.warning("No users found matching the given criteria")
             return {"error": "No users found matching the given criteria"}
 
-        all_tasks = []
-        for user in filtered_users:
-            logger.debug(f"Getting tasks for user: {user.get('id')}")
-            tasks = self.filter_tasks(assignee_ids=[user['id']], target_object_type="domain")
-            logger.debug(f"Retrieved {len(tasks) if tasks else 0} tasks for user {user.get('id')}")
-            if tasks:
-                all_tasks.extend(tasks)
+        # The filter endpoint takes a list of assignees, so every matching user's tasks come back in one request
+        all_tasks = self.filter_tasks(assignee_ids=[user['id'] for user in filtered_users], target_object_type="domain")
 
         if not all_tasks:
             logger.warning("No tasks found for the specified user(s)")
             return {"error": "No tasks found for the specified user(s)"}
 
-        logger.debug(f"Returning {len(all_tasks)} tasks in total")
+        logger.debug("Returning %s tasks in total", len(all_tasks))
         return all_tasks
 
     def get_all_tasks(self, raw=False):
         """
-        Retrieves all tasks by iterating through all users in the organization,
-        and gathering each user's tasks using filter_tasks.
+        Retrieves all tasks assigned to the users in the organization with a single
+        filter_tasks request listing every user as an assignee.
 
         :param raw: If True, return raw response text; otherwise return parsed JSON.
-        :return: All tasks combined from various calls.
+        :return: All tasks assigned to the organization's users.
         """
-        all_tasks = []
-
         # Step 1: Retrieve all users in the organization
         users = self.users_api.get_organization_users()
         if not users:
             logger.warning("No users found.")
             return {"error": "No users found."}
 
-        # Step 2: Iterate through each user and retrieve their tasks
-        for user in users:
-            user_id = user.get('id')
-            if not user_id:
-                continue
-
-            # Use the user ID as a list in the filter
-            tasks_for_user = self.filter_tasks(
-                assignee_ids=[user_id],  # Always pass user_id as a list
-                raw=raw
-            )
-            
-            logger.debug(f"Retrieved {len(tasks_for_user) if tasks_for_user else 0} tasks for user {user_id}")
-            
-            if tasks_for_user:
-                all_tasks.extend(tasks_for_user)
+        # Step 2: Retrieve every user's tasks in one request, passing all user IDs as assignees
+        user_ids = [user.get('id') for user in users if user.get('id')]
+        all_tasks = self.filter_tasks(assignee_ids=user_ids, raw=raw)
+
+        if raw:
+            return all_tasks
 
         # Step 3: Check if any tasks were found
         if not all_tasks:
             logger.warning("No tasks found.")
             return {"error": "No tasks found."}
 
-        logger.debug(f"Total tasks retrieved: {len(all_tasks)}")
+        logger.debug("Total tasks retrieved: %s", len(all_tasks))
         return all_tasks
 
+    def iter_all_tasks(self):
+        """
+        Iterate over all tasks assigned to the users in the organization without building one list.
+        The users are requested as assignees FILTER_BATCH_SIZE at a time, and the request for the
+        next batch is sent on a worker thread while the current batch's tasks are yielded, so at
+        most two batch responses are held in memory at once. A failed batch request raises
+        ValueError instead of silently leaving its tasks out.
+
+        :return: Iterator yielding task dicts.
+        """
+        users = self.users_api.get_organization_users()
+        user_ids = [user.get('id') for user in users or [] if user.get('id')]
+        batch_size = self.FILTER_BATCH_SIZE
+        batches = [user_ids[start:start + batch_size] for start in range(0, len(user_ids), batch_size)]
+
+        future = submit(self.filter_tasks, assignee_ids=batches[0]) if batches else None
+        try:
+            for index in range(len(batches)):
+                tasks = future.result()
+                future = None
+                if tasks is None:
+                    # The client has already logged the failed request
+                    raise ValueError("No data returned from filter_tasks.")
+                if index + 1 < len(batches):
+                    future = submit(self.filter_tasks, assignee_ids=batches[index + 1])
+                yield from tasks
+        finally:
+            # The caller stopped iterating early; drop the request if it has not started yet
+            if future is not None:
+                future.cancel()
 
-        
     def get_all_tasks_by_status(self, raw=False):
-        all_tasks = []
+        """
+        Retrieves the tasks in every task status of the organization with a single
+        filter_tasks request listing all status IDs. The statuses come from the cached
+        get_task_statuses.
 
+        :param raw: If True, return raw response text; otherwise return parsed JSON.
+        :return: All tasks in any of the organization's task statuses.
+        """
         task_statuses = self.task_statuses_api.get_task_statuses()
         if not task_statuses:
             logger.warning("No task statuses found.")
             return {"error": "No task statuses found."}
 
-        # Loop through each status to filter tasks by status
-        for status in task_statuses:
-            status_id = status.get('id')  # or use the name field if that's easier
-            tasks_for_status = self.filter_tasks(task_status_id=status_id, raw=raw)
-            logger.debug(f"Retrieved {len(tasks_for_status) if tasks_for_status else 0} tasks for status {status['name']}")
-            
-            if tasks_for_status:
-                all_tasks.extend(tasks_for_status)
+        status_ids = [status.get('id') for status in task_statuses if status.get('id')]
+        all_tasks = self.filter_tasks(task_status_ids=status_ids, raw=raw)
+        logger.debug("Retrieved %s tasks for %s statuses", len(all_tasks) if all_tasks else 0, len(status_ids))
+
+        if raw:
+            return all_tasks
 
         if not all_tasks:
             logger.warning("No tasks found.")
             return {"error": "No tasks found."}
 
         return all_tasks
-
@@ -9,18 +9,17 @@
 # The UsersAPI class is responsible for handling interactions with the Users API,
 # allowing for retrieving information about the currently authenticated user and organization users.
 
-from .utils import logger
+from .utils import logger, _clean_params, ttl_cache, _BaseAPI
 
-class UsersAPI:
+class UsersAPI(_BaseAPI):
     """
     This class handles interactions with the Users API of Hyperproof.
     It allows retrieving information about the currently authenticated user and organization users.
     """
     BASE_URL = "https://api.hyperproof.app/v1/users"
-
-    def __init__(self, api_client):
-        # Use the shared API client
-        self.client = api_client
+    _URL_ROOT = BASE_URL + "/"
+    _URL_ME = BASE_URL + "/me"
+    __slots__ = ()
 
     def get_current_user(self, expand=None, raw=False):
         """
@@ -30,22 +29,25 @@ class UsersAPI:
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        params = {
-            'expand': expand
-        }
-        return self.client.get(self.BASE_URL, "/me", params=params, raw=raw)
+        params = _clean_params(
+            expand=expand
+        )
+        return self.client.get(self._URL_ME, params=params, raw=raw)
 
+    @ttl_cache(ttl_seconds=60, maxsize=4, stale_on_error=True)
     def get_organization_users(self, expand=None, include_deactivated=False, raw=False):
         """
         Retrieves the users in an organization.
+        Responses are cached for one minute; call hyperproof.clear_cache() to force a refresh.
+        If the API cannot be reached, the last cached response is returned instead.
 
         :param expand: Comma-separated list of fields to expand. Supported values: 'identityProviders', 'organizationRoleId' (optional).
         :param include_deactivated: Whether or not to include deactivated users in the response (default is False).
         :param raw: If True, return raw response text; otherwise return parsed JSON.
         :return: Response data in the desired format (raw or parsed JSON).
         """
-        params = {
-            'expand': expand,
-            'includeDeactivated': include_deactivated
-        }
-        return self.client.get(self.BASE_URL, "/", params=params, raw=raw)
+        params = _clean_params(
+            expand=expand,
+            includeDeactivated=include_deactivated
+        )
+        return self.client.get(self._URL_ROOT, params=params, raw=raw)
@@ -8,64 +8,395 @@
 #
 # Description:
 # The APIClient class handles authentication via OAuth, and it provides methods 
-# for making GET, POST, PUT, and PATCH requests. The class ensures token-based 
+# for making GET, POST, PUT, PATCH, and DELETE requests. The class ensures token-based 
 # authorization is applied to every request. Error handling and logging are used to 
 # capture and report request issues.
 
+import asyncio
+import inspect
+import os
+import threading
+import time
 import requests
 import logging
+from functools import wraps
+from concurrent.futures import Future, ThreadPoolExecutor
+from dotenv import load_dotenv, find_dotenv
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, RequestException, Timeout, ConnectionError
+from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import json
 
+# orjson is an optional, faster JSON backend. It parses bytes directly and serializes to bytes;
+# without it the standard library json module is used.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
 # Set up logging
-# A logger named 'Hyperproof API' is created to capture logs for this module.
+# A logger named 'Hyperproof API' is created to capture logs for this module. Only a
+# NullHandler is attached and no level is set, so records go wherever (and at whatever
+# level) the application configures logging, without being formatted or emitted twice.
 logger = logging.getLogger('Hyperproof API')
-logger.setLevel(logging.INFO)  # Default logging level set to INFO
+if not logger.handlers:
+    logger.addHandler(logging.NullHandler())
 
-# Create a console handler for the logger and set its logging level to DEBUG.
-ch = logging.StreamHandler()
-ch.setLevel(logging.DEBUG)
+# OAuth token endpoint for Hyperproof's authentication.
+TOKEN_ENDPOINT = "https://accounts.hyperproof.app/oauth/token"
 
-# Formatter is created to display logs in a specific format: time, logger name, 
-# logging level, and the actual log message.
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Access tokens are refreshed this many seconds before they expire, so requests in flight
+# never carry a token that lapses on the way. Tokens without expires_in are kept for an hour.
+TOKEN_REFRESH_MARGIN = 60
+DEFAULT_TOKEN_LIFETIME = 3600
 
-# Attach the formatter to the console handler.
-ch.setFormatter(formatter)
+# Default (connect, read) timeouts in seconds for every request, so a stalled connection
+# cannot block a caller or a worker thread indefinitely. Connect timeouts, and read timeouts
+# of idempotent requests, are retried with backoff by RETRY_STRATEGY before being reported.
+DEFAULT_TIMEOUT = (3.05, 30)
 
-# Attach the console handler to the logger.
-logger.addHandler(ch)
+# Connection pool sizing for the shared session. One pool is kept per host
+# (accounts.hyperproof.app and api.hyperproof.app), each holding up to
+# POOL_MAXSIZE keep-alive connections.
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 32
+
+# Transient failures (throttling and gateway errors) are retried by urllib3
+# on the same pooled connection with exponential backoff, waiting as long as a
+# Retry-After header asks. Only idempotent methods (GET, PUT, DELETE, ...) are
+# retried, so a POST or PATCH that reached the server is never applied twice. Once
+# the retries are used up, the last response is handed back and reported as an HTTP error.
+RETRY_STRATEGY = Retry(total=5, backoff_factor=0.25, status_forcelist=[429, 500, 502, 503, 504],
+                       allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                       respect_retry_after_header=True, raise_on_status=False)
+
+# Compressed responses accepted from the API. urllib3 lists gzip and deflate, plus br (and zstd)
+# when a decoder for them is installed, so only encodings it can decompress are advertised.
+# Responses are decompressed transparently before they are parsed.
+ACCEPT_ENCODING_HEADER = ACCEPT_ENCODING.replace(",", ", ")
+
+# Worker threads shared by the methods that issue independent requests concurrently.
+# Kept well below POOL_MAXSIZE so concurrent requests never wait for a pooled connection.
+MAX_WORKERS = 8
+_WORKER_NAME_PREFIX = "hyperproof"
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix=_WORKER_NAME_PREFIX)
+
+def submit(fn, *args, **kwargs):
+    """
+    Schedules fn(*args, **kwargs) on the shared worker pool and returns a Future.
+    When called from one of the pool's own workers the call runs inline instead, so nested
+    fan-out can never deadlock by waiting on a saturated pool.
+    """
+    if threading.current_thread().name.startswith(_WORKER_NAME_PREFIX):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as err:
+            future.set_exception(err)
+        return future
+    return _executor.submit(fn, *args, **kwargs)
+
+# Size of the blocks read from disk and written to the socket when uploading files.
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Set once the .env file has been looked up, so the search runs at most once per process.
+_env_loaded = False
+
+def _ensure_env():
+    """
+    Loads the credentials from a .env file the first time they are needed.
+    Skipped entirely when CLIENT_ID and CLIENT_SECRET are already set in the environment.
+    The HYPERPROOF_DOTENV_PATH environment variable can point directly at the .env file,
+    which avoids searching the parent directories for it.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+
+    if os.getenv("CLIENT_ID") and os.getenv("CLIENT_SECRET"):
+        return
+
+    load_dotenv(os.getenv("HYPERPROOF_DOTENV_PATH") or find_dotenv())
+
+def _clean_params(**kwargs):
+    """
+    Builds a query parameter (or filter body) dict from keyword arguments, leaving out
+    any argument that is None so unset filters are not sent to the API.
+    """
+    return {key: value for key, value in kwargs.items() if value is not None}
+
+
+def _as_list(value):
+    """
+    Normalizes an ID filter argument to a new list: lists, tuples and sets are copied, a single
+    value is wrapped, and None becomes an empty list. The caller's list is never modified.
+    """
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [] if value is None else [value]
+
+
+# Placeholder for a request body field that must be sent as null to clear it on the server,
+# so _compact can tell a deliberate clear from an argument that was simply not given.
+_CLEAR = object()
+
+def _compact(data):
+    """
+    Drops the None values from a request body dict so unset fields are neither sent nor
+    overwritten on the server. Fields set to _CLEAR are kept and sent as null.
+    """
+    return {key: None if value is _CLEAR else value for key, value in data.items() if value is not None}
+
+
+def filter_users(users, userid=None, givenName=None, surname=None):
+    """
+    Selects the organization users matching the criteria used by the *_by_user methods.
+    A user matches when userid equals its `id` or `userId`, or when every given name field
+    (givenName and/or surname) equals the user's. The users are checked in a
+    single pass, and matches are returned in the order of users.
+    - users: List of user records as returned by get_organization_users.
+    - userid: The unique identifier of the user (optional).
+    - givenName: The given name of the user (optional).
+    - surname: The surname of the user (optional).
+    Returns the list of matching users.
+    """
+    if not users:
+        return []
+
+    # Only the name fields that were given take part in the match, and they are compared
+    # together as a single tuple.
+    name_keys = tuple(key for key, value in (('givenName', givenName), ('surname', surname)) if value)
+    wanted_names = tuple(value for value in (givenName, surname) if value)
+
+    return [user for user in users
+            if (userid and userid in (user.get('id'), user.get('userId')))
+            or (name_keys and tuple(user.get(key) for key in name_keys) == wanted_names)]
+
+
+def user_id_set(users):
+    """
+    Returns the set of identifiers (`id` and `userId`) of the given users, for O(1) membership
+    tests when joining other records (owner, createdBy, ...) against them.
+    """
+    ids = {user.get('id') for user in users} | {user.get('userId') for user in users}
+    ids.discard(None)
+    return ids
+
+
+# Every cache created by ttl_cache, so clear_caches can empty them all at once.
+_caches = []
+
+def _shallow_copy(result):
+    """
+    Returns a new list or dict holding the same items as a cached result, so a caller adding or
+    removing items does not change what later calls receive. Raw text results are returned as-is.
+    """
+    if isinstance(result, list):
+        return list(result)
+    if isinstance(result, dict):
+        return dict(result)
+    return result
+
+def ttl_cache(ttl_seconds=300, maxsize=4, stale_on_error=False):
+    """
+    Decorator memoizing the results of an API method for ttl_seconds, for endpoints whose
+    data rarely changes (task statuses, roles, records looked up by id, ...). Entries are
+    keyed on the API client and the call arguments (positional and keyword forms of the same
+    call share an entry), so instances sharing a client share their cached responses.
+    Failed calls (None results) are never cached. At most maxsize entries are kept; the
+    oldest entry is dropped first. Concurrent calls with the same arguments share a single request.
+    With stale_on_error, a failed call returns the last cached response for the same arguments,
+    even if it has expired, so reference data stays available while the API is unreachable.
+    Each call receives a shallow copy of a cached list or dict; the records inside are shared
+    with the cache and must not be modified in place.
+    The decorated method gains cache_clear() and cache_evict(api, *args), which drops the
+    entries of api's client whose leading arguments equal args (e.g. one record id).
+    - ttl_seconds: Number of seconds a cached response stays valid.
+    - maxsize: Maximum number of cached responses per decorated method.
+    - stale_on_error: If True, fall back to an expired response when the call fails.
+    """
+    def decorator(method):
+        cache = {}
+        inflight = {}
+        lock = threading.Lock()
+        signature = inspect.signature(method)
+
+        def make_key(self, args, kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            return (self.client,) + tuple(bound.arguments.values())[1:]
+
+        def load(self, args, kwargs, key, now, entry):
+            result = method(self, *args, **kwargs)
+            if result is None:
+                if stale_on_error and entry is not None:
+                    logger.warning(f"{method.__qualname__} failed; returning the cached response from "
+                                   f"{now - entry[0] + ttl_seconds:.0f} seconds ago")
+                    return entry[1]
+            else:
+                with lock:
+                    cache.pop(key, None)
+                    while len(cache) >= maxsize:
+                        cache.pop(next(iter(cache)))
+                    cache[key] = (now + ttl_seconds, result)
+            return result
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = make_key(self, args, kwargs)
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and entry[0] > now:
+                    return _shallow_copy(entry[1])
+                # Callers arriving while the same call is in flight wait for its result
+                # instead of sending a duplicate request.
+                future = inflight.get(key)
+                if future is None:
+                    future = inflight[key] = Future()
+                    leader = True
+                else:
+                    leader = False
+            if not leader:
+                return _shallow_copy(future.result())
+
+            try:
+                result = load(self, args, kwargs, key, now, entry)
+            except BaseException as err:
+                # Also covers KeyboardInterrupt and SystemExit, so waiting callers are never left blocked
+                future.set_exception(err)
+                raise
+            else:
+                future.set_result(result)
+            finally:
+                with lock:
+                    inflight.pop(key, None)
+            return _shallow_copy(result)
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        def cache_evict(api, *args):
+            prefix = (api.client,) + args
+            with lock:
+                for key in [key for key in cache if key[:len(prefix)] == prefix]:
+                    del cache[key]
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_evict = cache_evict
+        _caches.append(wrapper)
+        return wrapper
+    return decorator
+
+def clear_caches():
+    """
+    Empties every ttl_cache, so the next call to a cached method goes to the API.
+    """
+    for cached in _caches:
+        cached.cache_clear()
+
+
+class _BaseAPI:
+    """
+    Base class of the *API classes, holding the shared APIClient every request goes through.
+    Subclasses list only their additional attributes in __slots__, so no instance has a __dict__.
+    """
+    __slots__ = ("client",)
+
+    def __init__(self, api_client):
+        # Use the shared API client
+        self.client = api_client
+
+
+class _StreamingUpload:
+    """
+    File-like view over a multipart encoder that is sent in fixed-size chunks.
+    The request body is produced incrementally from the underlying files, so memory use
+    stays at one chunk regardless of the size of the upload. Exposing `len` lets requests
+    send a Content-Length header instead of falling back to chunked transfer encoding.
+    """
+    __slots__ = ("content_type", "len", "_body", "_chunk_size")
+
+    def __init__(self, fields, chunk_size=UPLOAD_CHUNK_SIZE, progress_callback=None):
+        """
+        Builds the multipart body for the given form fields.
+        - fields: Mapping of field names to string values or (filename, file object, content type) tuples.
+        - chunk_size: Number of bytes to send per read.
+        - progress_callback: Optional callable invoked with a MultipartEncoderMonitor after each read;
+          its `bytes_read` and `len` attributes report upload progress.
+        """
+        encoder = MultipartEncoder(fields=fields)
+        self.content_type = encoder.content_type
+        self.len = encoder.len
+        self._body = MultipartEncoderMonitor(encoder, progress_callback) if progress_callback else encoder
+        self._chunk_size = chunk_size
+
+    def read(self, size=-1):
+        return self._body.read(self._chunk_size)
+
+
+def _form_fields(data):
+    """
+    Converts a dict of form values to multipart fields, dropping unset (None) values and
+    encoding booleans the way the API expects them ('true' / 'false').
+    """
+    fields = {}
+    for key, value in (data or {}).items():
+        if value is None:
+            continue
+        fields[key] = ('true' if value else 'false') if isinstance(value, bool) else str(value)
+    return fields
 
-# OAuth token endpoint for Hyperproof's authentication.
-TOKEN_ENDPOINT = "https://accounts.hyperproof.app/oauth/token"
 
 class APIClient:
     """
     The APIClient class handles authentication via OAuth2 and makes HTTP requests to the Hyperproof API.
     This class manages the access token required for authorization and includes methods to interact
-    with the API (GET, POST, PUT, PATCH).
+    with the API (GET, POST, PUT, PATCH, DELETE).
+
+    All requests go through a single requests.Session so TCP and TLS connections are
+    kept alive and reused across calls instead of being re-established for every request.
     """
     
-    def __init__(self, client_id, client_secret):
+    def __init__(self, client_id=None, client_secret=None, timeout=DEFAULT_TIMEOUT):
         """
-        Initializes the APIClient with the given client credentials and authenticates immediately.
-        - client_id: The OAuth client ID for authenticating with Hyperproof.
-        - client_secret: The OAuth client secret for authenticating with Hyperproof.
+        Initializes the APIClient with the given client credentials.
+        - client_id: The OAuth client ID for authenticating with Hyperproof (defaults to CLIENT_ID from the environment).
+        - client_secret: The OAuth client secret for authenticating with Hyperproof (defaults to CLIENT_SECRET from the environment).
+        - timeout: (connect, read) timeout in seconds applied to every request, or a single number for both.
         
-        The access_token is initially set to None. Upon initialization, the client attempts to 
-        authenticate by calling the `_authenticate()` method.
+        The access_token is initially set to None. The client authenticates on the first request,
+        so constructing it does not touch the network or the filesystem.
         """
         self.client_id = client_id
         self.client_secret = client_secret
+        self._timeout = timeout
         self.access_token = None  # Access token will be set upon successful authentication.
+        self._token_expiry = 0.0  # time.monotonic() after which the access token is refreshed.
+        self._auth_lock = threading.Lock()  # Ensures concurrent requests authenticate only once.
+        self._headers = (None, None)  # (access token, request headers built for it)
+
+        # Persistent session with a pooled, retrying adapter shared by every request.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                                                    pool_maxsize=POOL_MAXSIZE,
+                                                    max_retries=RETRY_STRATEGY))
+        self._session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': ACCEPT_ENCODING_HEADER})
         
         logger.debug(f"Initializing APIClient with client_id: {client_id}")
-        
-        try:
-            self._authenticate()  # Attempt to authenticate upon initialization.
-        except Exception as e:
-            logger.error(f"Failed to authenticate: {e}")
-            self.access_token = None  # Ensure token remains None if authentication fails.
 
     def _authenticate(self):
         """
@@ -74,29 +405,34 @@ class APIClient:
         If successful, the access token is stored for future requests.
         """
         logger.debug("Authenticating to get access token")
+
+        # Credentials not passed to the constructor are read from the environment (or .env) now,
+        # so changes made to the environment after import are still picked up.
+        _ensure_env()
         
         # Parameters required for the OAuth2 client credentials grant type.
         params = {
             "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret
+            "client_id": self.client_id or os.getenv("CLIENT_ID"),
+            "client_secret": self.client_secret or os.getenv("CLIENT_SECRET")
         }
         
-        logger.debug(f"Authentication params: {json.dumps(params, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Authentication params: {json.dumps(params)}")
         
         try:
             # Sending POST request to OAuth token endpoint to obtain the access token.
-            response = requests.post(TOKEN_ENDPOINT, data=params)
+            response = self._session.post(TOKEN_ENDPOINT, data=params, timeout=self._timeout)
             
             # Log the status code and response details for debugging purposes.
-            logger.debug(f"Token request status code: {response.status_code}")
-            logger.debug(f"Token response headers: {json.dumps(dict(response.headers), indent=2)}")
-            logger.debug(f"Token response body: {response.text}")
+            self._log_response("Token", response)
 
             if response.status_code == 200:
                 # Parse and store the access token if authentication is successful.
                 response_json = self._parse_json(response)
                 self.access_token = response_json.get('access_token')
+                lifetime = int(response_json.get('expires_in') or DEFAULT_TOKEN_LIFETIME)
+                self._token_expiry = time.monotonic() + lifetime - TOKEN_REFRESH_MARGIN
                 logger.debug("Access token retrieved successfully")
             else:
                 # Log an error if the token request fails (e.g., invalid credentials).
@@ -107,130 +443,204 @@ class APIClient:
             logger.error(f"Error during authentication: {err}")
             self.access_token = None
 
+    def close(self):
+        """
+        Closes the underlying session and releases any pooled connections.
+        """
+        logger.debug("Closing APIClient session")
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Release the pooled connections when used as a context manager
+        self.close()
+
     def _get_headers(self):
         """
-        Constructs the headers required for API requests.
+        Returns the headers required for API requests, including the Authorization Bearer token.
         If the access token is missing or expired, the client will attempt to re-authenticate.
-        Returns the headers including the Authorization Bearer token.
+        The returned dict is shared between requests and must not be modified.
         """
-        if not self.access_token:
-            logger.debug("Access token not found. Re-authenticating...")
-            self._authenticate()  # Re-authenticate if no valid access token is available.
+        if not self.access_token or time.monotonic() >= self._token_expiry:
+            with self._auth_lock:
+                # Another thread may have authenticated while this one waited for the lock.
+                if not self.access_token or time.monotonic() >= self._token_expiry:
+                    logger.debug("Access token missing or about to expire. Re-authenticating...")
+                    self._authenticate()  # Re-authenticate if no valid access token is available.
         
         # Headers for the API request, including the Authorization token and content type.
-        headers = {
-            'Authorization': f'Bearer {self.access_token}',
-            'Content-Type': 'application/json'
-        }
-        logger.debug(f"Request headers: {json.dumps(headers, indent=2)}")
+        # They are built once per access token and reused until the token changes.
+        token, headers = self._headers
+        if headers is None or token != self.access_token:
+            token = self.access_token
+            headers = {
+                'Authorization': f'Bearer {token}',
+                'Content-Type': 'application/json'
+            }
+            self._headers = (token, headers)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Request headers: {json.dumps(headers)}")
         return headers
 
-    def get(self, base_url, endpoint, params=None, raw=False):
+    def _refresh_token(self, rejected_headers):
         """
-        Sends a GET request to the specified API endpoint.
+        Re-authenticates after the API rejected a request made with rejected_headers (HTTP 401).
+        When several requests are rejected at once, only the first one fetches a new token.
+        """
+        with self._auth_lock:
+            if self._headers[1] is rejected_headers:
+                logger.debug("Access token rejected. Re-authenticating...")
+                self.access_token = None
+                self._authenticate()
+
+    def _send(self, method, url, **kwargs):
+        """
+        Sends a request with the current authorization headers through the pooled session.
+        If the access token is rejected (HTTP 401), a new token is fetched and the request is
+        sent once more.
+        """
+        headers = self._get_headers()
+        response = self._session.request(method, url, headers=headers, timeout=self._timeout, **kwargs)
+        if response.status_code == 401:
+            self._refresh_token(headers)
+            response = self._session.request(method, url, headers=self._get_headers(), timeout=self._timeout, **kwargs)
+        return response
+
+    def _request(self, method, base_url, endpoint="", params=None, data=None, files=None, raw=False,
+                 chunk_size=UPLOAD_CHUNK_SIZE, progress_callback=None):
+        """
+        Sends a request to the specified API endpoint and handles its response. The public
+        verb methods (get, post, put, patch, delete) are thin wrappers around this method.
+        - method: The HTTP method ('GET', 'POST', ...).
         - base_url: The base URL for the API.
-        - endpoint: The specific API endpoint to interact with.
+        - endpoint: The specific API endpoint to interact with. May be omitted when base_url
+          is already the full URL of the endpoint.
         - params: Optional query parameters to include in the request.
+        - data: Optional JSON payload to include in the request body. When files are given,
+          these values are sent as form fields alongside the files instead.
+        - files: Optional file payload for multipart requests. The multipart body is streamed
+          from the open files rather than built in memory.
         - raw: If True, returns the raw response body; otherwise, returns parsed JSON.
+        - chunk_size: Number of bytes sent per read when streaming a multipart upload.
+        - progress_callback: Optional callable receiving a MultipartEncoderMonitor as the upload progresses.
         """
-        url = f"{base_url}{endpoint}"
-        logger.debug(f"Sending GET request to: {url}")
-        logger.debug(f"GET request params: {json.dumps(params, indent=2)}")
-        
+        url = base_url + endpoint if endpoint else base_url
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending {method} request to: {url}")
+            if params is not None:
+                logger.debug(f"{method} request params: {json.dumps(params)}")
+            if data is not None:
+                logger.debug(f"{method} request data: {json.dumps(data)}")
+            if files:
+                logger.debug(f"{method} request files: {list(files)}")
+
         try:
-            # Sending the GET request with appropriate headers and parameters.
-            response = requests.get(url, headers=self._get_headers(), params=params)
-            
+            if files:
+                # A streamed upload cannot be replayed, so it is not retried after a 401;
+                # the token is still refreshed ahead of expiry by _get_headers.
+                fields = _form_fields(data)
+                fields.update(files)
+                body = _StreamingUpload(fields, chunk_size=chunk_size, progress_callback=progress_callback)
+                headers = dict(self._get_headers(), **{'Content-Type': body.content_type})
+                response = self._session.request(method, url, headers=headers, data=body, timeout=self._timeout)
+            else:
+                response = self._send(method, url, params=params, data=self._encode_body(data))
+
             # Log the response status and body for debugging purposes.
-            logger.debug(f"GET response status code: {response.status_code}")
-            logger.debug(f"GET response headers: {json.dumps(dict(response.headers), indent=2)}")
-            logger.debug(f"GET response body: {response.text}")
-            
+            self._log_response(method, response)
+
             return self._handle_response(response, raw=raw)
+        except Timeout as e:
+            logger.error(f"{method} request timed out: {e}")
+            return None
         except Exception as e:
-            # Log any exceptions that occur during the GET request.
-            logger.error(f"GET request failed: {e}")
+            # Log any exceptions that occur during the request.
+            logger.error(f"{method} request failed: {e}")
             return None
 
-    def post(self, base_url, endpoint, data=None, files=None, raw=False):
+    def get(self, base_url, endpoint="", params=None, raw=False):
+        """
+        Sends a GET request to the specified API endpoint.
+        - base_url: The base URL for the API.
+        - endpoint: The specific API endpoint to interact with. May be omitted when base_url
+          is already the full URL of the endpoint.
+        - params: Optional query parameters to include in the request.
+        - raw: If True, returns the raw response body; otherwise, returns parsed JSON.
+        """
+        return self._request('GET', base_url, endpoint, params=params, raw=raw)
+
+    def post(self, base_url, endpoint="", data=None, files=None, raw=False, chunk_size=UPLOAD_CHUNK_SIZE, progress_callback=None):
         """
         Sends a POST request to the specified API endpoint.
         - base_url: The base URL for the API.
-        - endpoint: The specific API endpoint to interact with.
-        - data: Optional JSON payload to include in the request body.
-        - files: Optional file payload for multipart requests.
+        - endpoint: The specific API endpoint to interact with. May be omitted when base_url
+          is already the full URL of the endpoint.
+        - data: Optional JSON payload to include in the request body. When files are given,
+          these values are sent as form fields alongside the files instead.
+        - files: Optional file payload for multipart requests. The multipart body is streamed
+          from the open files rather than built in memory.
         - raw: If True, returns the raw response body; otherwise, returns parsed JSON.
+        - chunk_size: Number of bytes sent per read when streaming a multipart upload.
+        - progress_callback: Optional callable receiving a MultipartEncoderMonitor as the upload progresses.
         """
-        url = f"{base_url}{endpoint}"
-        logger.debug(f"Sending POST request to: {url}")
-        logger.debug(f"POST request data: {json.dumps(data, indent=2)}")
-        logger.debug(f"POST request files: {files}")
-        
-        try:
-            # Sending the POST request, handling both JSON and file uploads.
-            if files:
-                response = requests.post(url, headers=self._get_headers(), files=files)
-            else:
-                response = requests.post(url, headers=self._get_headers(), json=data)
-            
-            logger.debug(f"POST response status code: {response.status_code}")
-            logger.debug(f"POST response headers: {json.dumps(dict(response.headers), indent=2)}")
-            logger.debug(f"POST response body: {response.text}")
-            
-            return self._handle_response(response, raw=raw)
-        except Exception as e:
-            logger.error(f"POST request failed: {e}")
-            return None
+        return self._request('POST', base_url, endpoint, data=data, files=files, raw=raw,
+                             chunk_size=chunk_size, progress_callback=progress_callback)
 
-    def put(self, base_url, endpoint, data=None, raw=False):
+    def put(self, base_url, endpoint="", data=None, raw=False):
         """
         Sends a PUT request to the specified API endpoint.
         - base_url: The base URL for the API.
-        - endpoint: The specific API endpoint to interact with.
+        - endpoint: The specific API endpoint to interact with. May be omitted when base_url
+          is already the full URL of the endpoint.
         - data: Optional JSON payload to include in the request body.
         - raw: If True, returns the raw response body; otherwise, returns parsed JSON.
         """
-        url = f"{base_url}{endpoint}"
-        logger.debug(f"Sending PUT request to: {url}")
-        logger.debug(f"PUT request data: {json.dumps(data, indent=2)}")
-        
-        try:
-            # Sending the PUT request with the provided data.
-            response = requests.put(url, headers=self._get_headers(), json=data)
-            
-            logger.debug(f"PUT response status code: {response.status_code}")
-            logger.debug(f"PUT response headers: {json.dumps(dict(response.headers), indent=2)}")
-            logger.debug(f"PUT response body: {response.text}")
-            
-            return self._handle_response(response, raw=raw)
-        except Exception as e:
-            logger.error(f"PUT request failed: {e}")
-            return None
+        return self._request('PUT', base_url, endpoint, data=data, raw=raw)
 
-    def patch(self, base_url, endpoint, data=None, raw=False):
+    def patch(self, base_url, endpoint="", data=None, raw=False):
         """
         Sends a PATCH request to the specified API endpoint.
         - base_url: The base URL for the API.
-        - endpoint: The specific API endpoint to interact with.
+        - endpoint: The specific API endpoint to interact with. May be omitted when base_url
+          is already the full URL of the endpoint.
         - data: Optional JSON payload to include in the request body.
         - raw: If True, returns the raw response body; otherwise, returns parsed JSON.
         """
-        url = f"{base_url}{endpoint}"
-        logger.debug(f"Sending PATCH request to: {url}")
-        logger.debug(f"PATCH request data: {json.dumps(data, indent=2)}")
-        
-        try:
-            # Sending the PATCH request with the provided data.
-            response = requests.patch(url, headers=self._get_headers(), json=data)
-            
-            logger.debug(f"PATCH response status code: {response.status_code}")
-            logger.debug(f"PATCH response headers: {json.dumps(dict(response.headers), indent=2)}")
-            logger.debug(f"PATCH response body: {response.text}")
-            
-            return self._handle_response(response, raw=raw)
-        except Exception as e:
-            logger.error(f"PATCH request failed: {e}")
-            return None
+        return self._request('PATCH', base_url, endpoint, data=data, raw=raw)
+
+    def delete(self, base_url, endpoint="", raw=False):
+        """
+        Sends a DELETE request to the specified API endpoint.
+        - base_url: The base URL for the API.
+        - endpoint: The specific API endpoint to interact with. May be omitted when base_url
+          is already the full URL of the endpoint.
+        - raw: If True, returns the raw response body; otherwise, returns parsed JSON.
+        """
+        return self._request('DELETE', base_url, endpoint, raw=raw)
+
+    def _encode_body(self, data):
+        """
+        Serializes a JSON request body to bytes (Content-Type is already application/json).
+        Returns None when there is no body to send.
+        """
+        return None if data is None else json_dumps(data)
+
+    def _log_response(self, label, response):
+        """
+        Logs the status code, content encoding, headers and body of a response at DEBUG level.
+        Nothing is formatted unless DEBUG logging is enabled, so the parsed (raw=False) path
+        never decodes the response body to text just for logging.
+        - label: Prefix identifying the request in the log (e.g. 'GET').
+        - response: The HTTP response object.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug(f"{label} response status code: {response.status_code}")
+        logger.debug(f"{label} response content encoding: {response.headers.get('Content-Encoding', 'identity')}")
+        logger.debug(f"{label} response headers: {json.dumps(dict(response.headers))}")
+        logger.debug(f"{label} response body: {response.text}")
 
     def _handle_response(self, response, raw=False):
         """
@@ -242,6 +652,10 @@ class APIClient:
         try:
             # Raise an exception if the response contains an HTTP error status code.
             response.raise_for_status()
+
+            # Empty responses (204 No Content, typical for updates and deletes) have nothing to parse.
+            if response.status_code == 204 or not response.content:
+                return '' if raw else {}
             
             if raw:
                 return response.text  # Return raw text if specified.
@@ -262,12 +676,15 @@ class APIClient:
         Safely parses the JSON content of a response, handling content-type validation
         and logging errors for unexpected or invalid content.
         - response: The HTTP response object to parse.
+        Uses orjson when it is installed and the standard json module otherwise.
         Returns the parsed JSON object or an empty dictionary if parsing fails.
         """
         try:
             # Ensure the response content-type is JSON before attempting to parse.
             if 'application/json' in response.headers.get('Content-Type', ''):
-                return response.json()  # Parse the response body as JSON.
+                # Parse the body bytes directly; this skips building the intermediate str that
+                # response.text / response.json() would decode first.
+                return json_loads(response.content)
             else:
                 logger.error(f"Unexpected content type: {response.headers.get('Content-Type')}")
                 return {}
@@ -275,3 +692,81 @@ class APIClient:
             # Log the JSON parsing error and return an empty dictionary.
             logger.error(f"Error parsing JSON: {val_err}")
             return {}
+
+
+class AsyncAPIClient:
+    """
+    The AsyncAPIClient class exposes the APIClient request methods as coroutines so callers
+    can overlap independent requests on one event loop. Each request is executed on a worker
+    thread against the wrapped APIClient, so authentication and the pooled session are shared
+    with the synchronous API.
+    """
+    __slots__ = ("client",)
+
+    def __init__(self, api_client):
+        """
+        Initializes the AsyncAPIClient around an existing APIClient.
+        - api_client: The APIClient instance used to send the requests.
+        """
+        self.client = api_client
+
+    async def get(self, base_url, endpoint="", params=None, raw=False):
+        """
+        Sends a GET request to the specified API endpoint without blocking the event loop.
+        Accepts the same arguments as APIClient.get.
+        """
+        return await asyncio.to_thread(self.client.get, base_url, endpoint, params=params, raw=raw)
+
+    async def post(self, base_url, endpoint="", data=None, files=None, raw=False, **kwargs):
+        """
+        Sends a POST request to the specified API endpoint without blocking the event loop.
+        Accepts the same arguments as APIClient.post.
+        """
+        return await asyncio.to_thread(self.client.post, base_url, endpoint, data=data, files=files, raw=raw, **kwargs)
+
+    async def put(self, base_url, endpoint="", data=None, raw=False):
+        """
+        Sends a PUT request to the specified API endpoint without blocking the event loop.
+        Accepts the same arguments as APIClient.put.
+        """
+        return await asyncio.to_thread(self.client.put, base_url, endpoint, data=data, raw=raw)
+
+    async def patch(self, base_url, endpoint="", data=None, raw=False):
+        """
+        Sends a PATCH request to the specified API endpoint without blocking the event loop.
+        Accepts the same arguments as APIClient.patch.
+        """
+        return await asyncio.to_thread(self.client.patch, base_url, endpoint, data=data, raw=raw)
+
+    async def delete(self, base_url, endpoint="", raw=False):
+        """
+        Sends a DELETE request to the specified API endpoint without blocking the event loop.
+        Accepts the same arguments as APIClient.delete.
+        """
+        return await asyncio.to_thread(self.client.delete, base_url, endpoint, raw=raw)
+
+
+async def collect_all_pages(fn, **kwargs):
+    """
+    Drains an asynchronous page iterator (e.g. aget_proof_metadata_collection) into a single list.
+    - fn: A callable returning an async iterator that yields lists of items.
+    - kwargs: Keyword arguments forwarded to fn.
+    Returns the items of every page, in order.
+    """
+    items = []
+    async for page in fn(**kwargs):
+        items.extend(page)
+    return items
+
+
+def run_many(*coroutines):
+    """
+    Runs coroutines (e.g. collect_all_pages calls) concurrently from synchronous code.
+    A new event loop is started for the call, so this must not be used inside a running loop;
+    await asyncio.gather there instead.
+    - coroutines: The coroutines to run.
+    Returns their results, in the order the coroutines were given.
+    """
+    async def gather():
+        return await asyncio.gather(*coroutines)
+    return asyncio.run(gather())